@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from smart_lighting_ai_dali.scripts.simulate_sensor import parse_args, simulate
-
 
 if __name__ == "__main__":
+    # Imported lazily so the interpreter does not pay for the package's
+    # pydantic/sqlalchemy import graph until the script actually runs.
+    from smart_lighting_ai_dali.scripts.simulate_sensor import parse_args, simulate
+
     args = parse_args()
-    simulate(args.endpoint, args.interval, args.duration, args.seed)
+    simulate(args.endpoint, args.interval, args.duration, args.seed, args.batch)
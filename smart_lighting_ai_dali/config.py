@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from functools import lru_cache
 from typing import List
 
@@ -25,6 +26,8 @@ class Settings(BaseSettings):
         validation_alias=AliasChoices("OPENAI_MODEL", "openai_model"),
     )
     openai_enable_reasoning: bool = Field(False)
+    # Client-side shaping budget for outbound OpenAI calls (requests/minute).
+    openai_rpm: int = Field(60)
     admin_token: str | None = Field(
         default=None,
         validation_alias=AliasChoices("ADMIN_TOKEN", "admin_token"),
@@ -39,6 +42,12 @@ class Settings(BaseSettings):
 
     anti_flicker_delta_per_second: int = Field(20)
     min_update_interval_seconds: int = Field(5)
+    # Artificial per-command delay for the stubbed hardware interface; off by
+    # default so the control loop is not serialized on real wall time.
+    simulate_transmission_delay: float = Field(0.0)
+
+    # Upper bound on the command history kept by the mock DALI interface.
+    mock_history_size: int = Field(1024)
 
     use_mock_dali: bool = Field(False, validation_alias="USE_MOCK_DALI")
     # Flag enabling legacy Tridonic adapters that only understand broadcast dimming.
@@ -54,6 +63,14 @@ class Settings(BaseSettings):
     glare_overcast_threshold: int = Field(600)
     glare_sunny_threshold: int = Field(800)
 
+    # Minimum interval between real database probes from /healthz.
+    health_cache_seconds: int = Field(5)
+
+    # Serve /diagnostics/dali row counts from the maintained counters table
+    # instead of COUNT(*) scans. Opt-in: counters track the API write paths
+    # and retention pruning, so out-of-band deletes can make them drift.
+    use_approx_counts: bool = Field(False)
+
     rate_limit_requests: int = Field(60)
     rate_limit_window_seconds: int = Field(60)
 
@@ -86,4 +103,35 @@ def get_settings() -> Settings:
     return Settings()
 
 
-__all__ = ["Settings", "get_settings"]
+@dataclass(frozen=True, slots=True)
+class SettingsSnapshot:
+    """Immutable copy of the hot-path settings.
+
+    Attribute access on a frozen slots dataclass skips Pydantic's descriptor
+    protocol, which matters for the per-command control and simulation loops.
+    """
+
+    min_update_interval_seconds: int
+    anti_flicker_delta_per_second: int
+    simulate_transmission_delay: float
+    dali_basic_mode: bool
+    mock_history_size: int
+
+
+@lru_cache()
+def get_settings_snapshot() -> SettingsSnapshot:
+    settings = get_settings()
+    return SettingsSnapshot(
+        **{
+            name: getattr(settings, name)
+            for name in SettingsSnapshot.__dataclass_fields__
+        }
+    )
+
+
+__all__ = [
+    "Settings",
+    "SettingsSnapshot",
+    "get_settings",
+    "get_settings_snapshot",
+]
@@ -1,22 +1,81 @@
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime, timedelta
 
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
-from .config import get_settings
+from .config import get_settings_snapshot
 from .dali import DALIInterface, clamp_cct, clamp_intensity
 from .feature_engineering import get_active_override
-from .models import Decision, FeatureRow, ManualOverride, Telemetry
+from .models import Decision, ManualOverride, Telemetry
 
 logger = logging.getLogger(__name__)
 
+# Energy-saving estimates for every possible clamped intensity, so apply()
+# does a tuple lookup instead of float arithmetic per decision.
+_ENERGY_SAVING_TABLE = tuple(
+    max(0.0, (100 - intensity) / 100.0) for intensity in range(101)
+)
+
 
 class ControlService:
     def __init__(self, dali: DALIInterface, settings=None) -> None:
         self.dali = dali
-        self.settings = settings or get_settings()
+        self.settings = settings or get_settings_snapshot()
+        # Plain ints bypass Pydantic's descriptor protocol on the hot path.
+        self._min_interval = int(self.settings.min_update_interval_seconds)
+        self._delta_per_s = int(self.settings.anti_flicker_delta_per_second)
+        # Static per interface instance, so no per-apply() reflection needed.
+        self._supports_cct = bool(getattr(self.dali, "supports_cct", True))
+        # Hot-path caches: the last committed decision and the active manual
+        # override, kept as plain snapshots so no SQL round-trip is needed on
+        # every apply().
+        self._last_decision: tuple[datetime, int, int] | None = None
+        self._last_decision_monotonic: float | None = None
+        self._override_cache: tuple[int, int, str | None, datetime] | None = None
+
+    def reset_state(self) -> None:
+        """Drop the cached decision/override snapshots.
+
+        Call when the underlying tables change outside this service (test
+        cleanup, retention replays) so the next apply() re-reads them.
+        """
+
+        self._last_decision = None
+        self._last_decision_monotonic = None
+        self._override_cache = None
+
+    def _latest_decision_snapshot(
+        self, session: Session
+    ) -> tuple[datetime, int, int] | None:
+        if self._last_decision is not None:
+            return self._last_decision
+        row = session.execute(
+            select(Decision.decided_at, Decision.intensity, Decision.cct)
+            .order_by(Decision.decided_at.desc())
+            .limit(1)
+        ).first()
+        if row is None:
+            return None
+        self._last_decision = (row.decided_at, row.intensity, row.cct)
+        return self._last_decision
+
+    def _active_override_snapshot(
+        self, session: Session
+    ) -> tuple[int, int, str | None] | None:
+        cached = self._override_cache
+        if cached is not None:
+            if datetime.utcnow() < cached[3]:
+                return cached[0], cached[1], cached[2]
+            self._override_cache = None
+        row = get_active_override(session)
+        if row is None:
+            return None
+        self._override_cache = (row.intensity, row.cct, row.reason, row.expires_at)
+        return row.intensity, row.cct, row.reason
 
     def _apply_anti_flicker(
         self,
@@ -26,34 +85,36 @@ class ControlService:
         *,
         supports_cct: bool = True,
     ) -> tuple[int, int]:
-        latest = (
-            session.query(Decision)
-            .order_by(Decision.decided_at.desc())
-            .first()
-        )
+        latest = self._latest_decision_snapshot(session)
         if not latest:
             return intensity, cct
-        elapsed = (datetime.utcnow() - latest.decided_at).total_seconds()
-        if elapsed < self.settings.min_update_interval_seconds:
-            logger.info(
-                "Skipping update due to min interval",
-                extra={"elapsed": elapsed},
-            )
-            return latest.intensity, latest.cct
-        max_delta = (
-            self.settings.anti_flicker_delta_per_second * max(elapsed, 1)
+        decided_at, last_intensity, last_cct = latest
+        if self._last_decision_monotonic is not None:
+            # Monotonic clock avoids two datetime allocations per apply() and
+            # is immune to wall-clock adjustments.
+            elapsed = time.monotonic() - self._last_decision_monotonic
+        else:
+            # Snapshot was recovered from the database; only the persisted
+            # wall-clock timestamp is available.
+            elapsed = (datetime.utcnow() - decided_at).total_seconds()
+        if elapsed < self._min_interval:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Skipping update due to min interval",
+                    extra={"elapsed": elapsed},
+                )
+            return last_intensity, last_cct
+        max_delta = int(self._delta_per_s * max(elapsed, 1))
+        # Branchless clamp: bounded step towards the target in one expression.
+        intensity = last_intensity + max(
+            -max_delta, min(max_delta, intensity - last_intensity)
         )
-        if abs(intensity - latest.intensity) > max_delta:
-            step = max_delta if intensity > latest.intensity else -max_delta
-            intensity = latest.intensity + int(step)
         if not supports_cct:
             # Basic DALI mode retains the most recent colour temperature.
-            cct = latest.cct
-        elif abs(cct - latest.cct) > max_delta * 20:  # allow larger delta for cct scaling
-            step_cct = (
-                max_delta * 20 if cct > latest.cct else -max_delta * 20
-            )
-            cct = latest.cct + int(step_cct)
+            cct = last_cct
+        else:
+            max_delta_cct = max_delta * 20  # allow larger delta for cct scaling
+            cct = last_cct + max(-max_delta_cct, min(max_delta_cct, cct - last_cct))
         return intensity, cct
 
     def apply(
@@ -64,7 +125,7 @@ class ControlService:
         cct: int,
         reason: str,
         source: str,
-        feature_row: FeatureRow | None = None,
+        feature_row_id: int | None = None,
         manual_override: bool = False,
         override_minutes: int | None = None,
     ) -> Decision:
@@ -81,22 +142,25 @@ class ControlService:
                 expires_at=expires,
                 active=True,
             )
+            # Committed together with the decision below; one transaction per
+            # apply() keeps SQLite to a single fsync.
             session.add(override)
-            session.commit()
+            # Refresh the cache so this apply() and later ones see the new
+            # override without re-querying.
+            self._override_cache = (intensity, cct, reason, expires)
             logger.info(
                 "Manual override stored",
                 extra={"expires_at": expires.isoformat()},
             )
 
-        active_override = get_active_override(session)
+        active_override = self._active_override_snapshot(session)
         override_applied = False
         if active_override:
-            intensity = active_override.intensity
-            cct = active_override.cct
-            reason = active_override.reason or reason
+            intensity, cct, override_reason = active_override
+            reason = override_reason or reason
             override_applied = True
 
-        supports_cct = bool(getattr(self.dali, "supports_cct", True))
+        supports_cct = self._supports_cct
         if not supports_cct:
             logger.info(
                 "Basic DALI mode active – retaining previous CCT value",
@@ -109,7 +173,7 @@ class ControlService:
             supports_cct=supports_cct,
         )
         self.dali.send_dt8(intensity, cct)
-        energy_saving = max(0.0, (100 - intensity) / 100.0)
+        energy_saving = _ENERGY_SAVING_TABLE[intensity]
         decision = Decision(
             intensity=intensity,
             cct=cct,
@@ -117,19 +181,24 @@ class ControlService:
             payload_bytes=0,
             source=source,
             energy_saving_estimate=energy_saving,
-            feature_row_id=feature_row.id if feature_row else None,
+            feature_row_id=feature_row_id,
             manual_override_applied=override_applied,
         )
         session.add(decision)
-        session.add(
-            Telemetry(
+        # Telemetry is write-only; a Core insert skips the ORM unit of work.
+        session.execute(
+            insert(Telemetry).values(
                 metric="energy_saving_estimate",
                 value=energy_saving,
                 detail=f"intensity={intensity}",
             )
         )
+        session.flush()
+        self._last_decision = (decision.decided_at, decision.intensity, decision.cct)
+        self._last_decision_monotonic = time.monotonic()
         session.commit()
-        session.refresh(decision)
+        # No refresh needed: the PK and all column values were populated at
+        # flush time, so an extra SELECT round-trip would be pure overhead.
         return decision
 
 
@@ -2,6 +2,7 @@
 
 from .interface import (
     DALIInterface,
+    DT8Command,
     MockDALIController,
     MockDALIInterface,
     TridonicUSBInterface,
@@ -12,6 +13,7 @@ from .interface import (
 
 __all__ = [
     "DALIInterface",
+    "DT8Command",
     "MockDALIController",
     "MockDALIInterface",
     "TridonicUSBInterface",
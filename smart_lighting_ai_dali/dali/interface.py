@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import logging
-import random
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Deque, Dict
 
-from ..config import get_settings
+import numpy as np
+
+from ..config import get_settings_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -15,13 +17,15 @@ logger = logging.getLogger(__name__)
 def clamp_intensity(intensity: int) -> int:
     """Clamp an intensity value to the valid 0-100 range."""
 
-    return max(0, min(100, int(intensity)))
+    intensity = int(intensity)
+    return 0 if intensity < 0 else 100 if intensity > 100 else intensity
 
 
 def clamp_cct(cct: int) -> int:
     """Clamp a correlated colour temperature to the valid DT8 range."""
 
-    return max(1800, min(6500, int(cct)))
+    cct = int(cct)
+    return 1800 if cct < 1800 else 6500 if cct > 6500 else cct
 
 
 @dataclass
@@ -53,14 +57,44 @@ class DALIInterface(ABC):
         return True
 
 
+# Precomputed DT8 payloads for every valid CCT (1800-6500 K) and every valid
+# intensity (0-100). Sending a command then only needs two tuple lookups
+# instead of float scaling and fresh bytes allocations on each call.
+_CCT_TABLE = tuple(
+    int((kelvin - 1800) / (6500 - 1800) * 65535).to_bytes(2, byteorder="big")
+    for kelvin in range(1800, 6501)
+)
+_INTENSITY_TABLE = tuple(value.to_bytes(1, "big") for value in range(101))
+
+
+def _basic_command(intensity: int) -> Dict[str, str]:
+    if intensity <= 0:
+        return {"type": "RECALL_MIN_LEVEL", "intensity": "0"}
+    if intensity > 70:
+        return {"type": "RECALL_MAX_LEVEL", "intensity": str(intensity)}
+    return {
+        "type": "DIRECT_ARC_POWER",
+        "arc_power": str(round(intensity / 100 * 254)),
+        "intensity": str(intensity),
+    }
+
+
+# Broadcast-only commands for every possible intensity, precomputed so basic
+# mode resolves each send with a single tuple lookup.
+_BASIC_CMD_TABLE = tuple(_basic_command(value) for value in range(101))
+_BASIC_LOG_MESSAGES = {
+    "RECALL_MIN_LEVEL": "Basic DALI mode active – sending RECALL MIN LEVEL",
+    "RECALL_MAX_LEVEL": "Basic DALI mode active – sending RECALL MAX LEVEL",
+    "DIRECT_ARC_POWER": "Basic DALI mode active – sending DIRECT ARC POWER",
+}
+
+
 def dt8_warm_cool_to_bytes(cct: int) -> bytes:
     """Map CCT to a DT8 warm/cool command (simplified for tunable white)."""
     # DALI DT8 typically uses 16-bit data, scaled 0-65535 for temperature.
     # We'll map 1800-6500 K to that range.
-    cct_clamped = clamp_cct(cct)
-    scale = (cct_clamped - 1800) / (6500 - 1800)
-    dali_value = int(scale * 65535)
-    return dali_value.to_bytes(2, byteorder="big")
+    cct = int(cct)
+    return _CCT_TABLE[(1800 if cct < 1800 else 6500 if cct > 6500 else cct) - 1800]
 
 
 class TridonicUSBInterface(DALIInterface):
@@ -69,7 +103,7 @@ class TridonicUSBInterface(DALIInterface):
     def __init__(self, settings=None) -> None:
         # We allow forcing broadcast-only behaviour via configuration to match
         # legacy Tridonic USB adapters that lack DT8 features.
-        self.settings = settings or get_settings()
+        self.settings = settings or get_settings_snapshot()
         self.basic_mode = bool(getattr(self.settings, "dali_basic_mode", False))
         self._last_command: DT8Command | None = None
         self._last_basic_command: Dict[str, str] | None = None
@@ -81,56 +115,38 @@ class TridonicUSBInterface(DALIInterface):
 
     def send_dt8(self, intensity: int, cct: int) -> None:
         intensity_clamped = clamp_intensity(intensity)
+        # Guard so the extra= dicts are only built when INFO is emitted.
+        log_info = logger.isEnabledFor(logging.INFO)
         if self.basic_mode:
             # Basic mode mimics IEC 62386-101 broadcast commands only.
-            if intensity_clamped <= 0:
-                logger.info(
-                    "Basic DALI mode active – sending RECALL MIN LEVEL",
-                    extra={"command": {"type": "RECALL_MIN_LEVEL"}},
-                )
-                self._last_basic_command = {"type": "RECALL_MIN_LEVEL", "intensity": "0"}
-            elif intensity_clamped > 70:
-                logger.info(
-                    "Basic DALI mode active – sending RECALL MAX LEVEL",
-                    extra={"command": {"type": "RECALL_MAX_LEVEL"}},
-                )
-                self._last_basic_command = {
-                    "type": "RECALL_MAX_LEVEL",
-                    "intensity": str(intensity_clamped),
-                }
-            else:
-                arc_power = round(intensity_clamped / 100 * 254)
+            command = _BASIC_CMD_TABLE[intensity_clamped]
+            if log_info:
                 logger.info(
-                    "Basic DALI mode active – sending DIRECT ARC POWER",
-                    extra={
-                        "command": {
-                            "type": "DIRECT_ARC_POWER",
-                            "arc_power": arc_power,
-                            "intensity": intensity_clamped,
-                        }
-                    },
+                    _BASIC_LOG_MESSAGES[command["type"]],
+                    extra={"command": command},
                 )
-                self._last_basic_command = {
-                    "type": "DIRECT_ARC_POWER",
-                    "arc_power": str(arc_power),
-                    "intensity": str(intensity_clamped),
-                }
+            self._last_basic_command = command
             self._last_command = None
-            time.sleep(0.05)
+            if self.settings.simulate_transmission_delay:
+                time.sleep(self.settings.simulate_transmission_delay)
             return
 
         cct_bytes = dt8_warm_cool_to_bytes(cct)
-        payload = DT8Command(address=0xFF, data=intensity_clamped.to_bytes(1, "big") + cct_bytes)
-        logger.info("Sending DT8 command", extra={
-            "command": {
-                "address": payload.address,
-                "intensity": intensity_clamped,
-                "cct": int.from_bytes(cct_bytes, "big"),
-            }
-        })
+        payload = DT8Command(
+            address=0xFF, data=_INTENSITY_TABLE[intensity_clamped] + cct_bytes
+        )
+        if log_info:
+            logger.info("Sending DT8 command", extra={
+                "command": {
+                    "address": payload.address,
+                    "intensity": intensity_clamped,
+                    "cct": int.from_bytes(cct_bytes, "big"),
+                }
+            })
         self._last_basic_command = None
         self._last_command = payload
-        time.sleep(0.05)  # simulate transmission delay
+        if self.settings.simulate_transmission_delay:
+            time.sleep(self.settings.simulate_transmission_delay)
 
     def diagnostics(self) -> dict[str, str]:
         if self.basic_mode:
@@ -148,24 +164,35 @@ class TridonicUSBInterface(DALIInterface):
 
 
 class MockDALIInterface(DALIInterface):
-    def __init__(self) -> None:
-        self.sent_commands: list[DT8Command] = []
+    def __init__(self, settings=None) -> None:
+        self.settings = settings or get_settings_snapshot()
+        # Bounded history of raw (intensity, cct_bytes) tuples; avoids
+        # unbounded growth and per-send dataclass construction in long
+        # simulation runs.
+        self.sent_commands: Deque[tuple[int, bytes]] = deque(
+            maxlen=int(self.settings.mock_history_size) or 1024
+        )
 
     def send_dt8(self, intensity: int, cct: int) -> None:
         intensity_clamped = clamp_intensity(intensity)
         cct_bytes = dt8_warm_cool_to_bytes(cct)
-        command = DT8Command(address=0xFF, data=intensity_clamped.to_bytes(1, "big") + cct_bytes)
-        logger.debug("Mock send DT8", extra={"command": command})
-        self.sent_commands.append(command)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Mock send DT8",
+                extra={
+                    "command": {"intensity": intensity_clamped, "cct_bytes": cct_bytes}
+                },
+            )
+        self.sent_commands.append((intensity_clamped, cct_bytes))
 
     def diagnostics(self) -> dict[str, str]:
         if not self.sent_commands:
             return {"status": "idle"}
-        last = self.sent_commands[-1]
+        last_intensity, last_cct_bytes = self.sent_commands[-1]
         return {
             "status": "ok",
-            "last_intensity": str(last.data[0]),
-            "last_cct_value": str(int.from_bytes(last.data[1:], "big")),
+            "last_intensity": str(last_intensity),
+            "last_cct_value": str(int.from_bytes(last_cct_bytes, "big")),
             "commands_sent": str(len(self.sent_commands)),
         }
 
@@ -179,10 +206,19 @@ class MockDALIController(DALIInterface):
         *,
         seed: int | None = None,
     ) -> None:
-        self.settings = settings or get_settings()
-        self._rng = random.Random(seed or 0)
+        self.settings = settings or get_settings_snapshot()
+        # Plain numbers bypass Pydantic's descriptor protocol per set_light().
+        self._min_interval = float(self.settings.min_update_interval_seconds)
+        self._delta_per_s = float(self.settings.anti_flicker_delta_per_second)
+        # Batched NumPy RNG: pre-fill sample buffers so high-rate simulation
+        # loops amortize RNG state updates across thousands of calls.
+        self._rng = np.random.default_rng(seed or 0)
+        self._rng_buf_size = 4096
+        self._rng_buf_idx = self._rng_buf_size  # force fill on first read
+        self._lux_jitter_buf: np.ndarray | None = None
+        self._presence_roll_buf: np.ndarray | None = None
         self._clock = 0.0
-        self._last_update_tick = -float(self.settings.min_update_interval_seconds)
+        self._last_update_tick = -self._min_interval
         self._state: Dict[str, Any] = {
             "intensity": 0,
             "cct": 4000,
@@ -196,11 +232,9 @@ class MockDALIController(DALIInterface):
         return self._clock
 
     def _limit_delta(self, current: int, target: int, limit: float) -> int:
-        delta = target - current
-        if abs(delta) <= limit:
-            return int(target)
-        step = limit if delta > 0 else -limit
-        return int(current + step)
+        # Branchless bounded step towards the target.
+        limit_int = int(limit)
+        return current + max(-limit_int, min(limit_int, target - current))
 
     def set_light(self, intensity: int, cct: int) -> dict[str, Any]:
         """Apply a light state while respecting anti-flicker bounds."""
@@ -209,14 +243,12 @@ class MockDALIController(DALIInterface):
         cct = clamp_cct(cct)
         elapsed = self._clock - self._last_update_tick
         applied = True
-        if elapsed < self.settings.min_update_interval_seconds:
+        if elapsed < self._min_interval:
             applied = False
             intensity = int(self._state["intensity"])
             cct = int(self._state["cct"])
         else:
-            max_delta = (
-                self.settings.anti_flicker_delta_per_second * max(elapsed, 1.0)
-            )
+            max_delta = self._delta_per_s * max(elapsed, 1.0)
             new_intensity = self._limit_delta(
                 int(self._state["intensity"]),
                 intensity,
@@ -239,29 +271,41 @@ class MockDALIController(DALIInterface):
         self._state["timestamp"] = timestamp
         snapshot = dict(self._state)
         self._history.append(snapshot)
-        logger.info(
-            "Mock DALI applied setpoint",
-            extra={"state": snapshot, "applied": applied},
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Mock DALI applied setpoint",
+                extra={"state": snapshot, "applied": applied},
+            )
         self._last_response = {"status": "ok", "applied": applied, "state": snapshot}
         return self._last_response
 
     def send_dt8(self, intensity: int, cct: int) -> None:
         self.set_light(intensity, cct)
 
+    def _refill_rng_buffers(self) -> None:
+        self._lux_jitter_buf = self._rng.integers(-20, 21, size=self._rng_buf_size)
+        self._presence_roll_buf = self._rng.random(self._rng_buf_size)
+        self._rng_buf_idx = 0
+
     def read_sensor(self) -> dict[str, int]:
         """Return a deterministic pseudo-random sensor observation."""
 
         timestamp = self._tick()
+        if self._rng_buf_idx >= self._rng_buf_size:
+            self._refill_rng_buffers()
+        jitter = int(self._lux_jitter_buf[self._rng_buf_idx])
+        presence_roll = float(self._presence_roll_buf[self._rng_buf_idx])
+        self._rng_buf_idx += 1
         baseline = max(80, 600 - int(self._state["intensity"]) * 3)
-        lux = max(10, int(baseline + self._rng.randint(-20, 20)))
+        lux = max(10, baseline + jitter)
         presence_threshold = 0.3 + (int(self._state["intensity"]) / 250.0)
-        presence = 1 if self._rng.random() < min(presence_threshold, 0.9) else 0
+        presence = 1 if presence_roll < min(presence_threshold, 0.9) else 0
         reading = {"lux": lux, "presence": presence}
-        logger.debug(
-            "Mock sensor reading",
-            extra={"reading": {**reading, "timestamp": timestamp}},
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Mock sensor reading",
+                extra={"reading": {**reading, "timestamp": timestamp}},
+            )
         return reading
 
     def diagnostics(self) -> dict[str, str]:
@@ -3,11 +3,22 @@ from __future__ import annotations
 import json
 import logging
 from datetime import datetime, timedelta
-from statistics import mean
+from functools import lru_cache
 from typing import List, Tuple
 
 from cryptography.fernet import Fernet, InvalidToken
-from sqlalchemy import asc, desc
+
+try:  # pragma: no cover - optional Rust-backed Fernet implementation
+    from rfernet import DecryptionError as RFernetDecryptionError
+    from rfernet import Fernet as RustFernet
+except Exception:  # noqa: BLE001
+    RustFernet = None
+
+    class RFernetDecryptionError(Exception):
+        """Fallback rfernet error when the package is unavailable."""
+
+
+from sqlalchemy import asc, case, desc, func
 from sqlalchemy.orm import Session
 
 from .config import get_settings
@@ -18,33 +29,43 @@ from .models import (
     RawSensorEvent,
     WeatherEvent,
 )
+from .sensor_ring import get_sensor_ring
 
 logger = logging.getLogger(__name__)
 
 
-def _load_profile_features(session: Session, settings) -> dict[str, str | None]:
-    profile = (
-        session.query(ParticipantProfile)
-        .order_by(desc(ParticipantProfile.updated_at))
-        .first()
-    )
-    if not profile:
-        return {
-            "age_bucket": None,
-            "sex_enum": None,
-            "impairment_enum": None,
-            "user_state": "default",
-            "chronotype_enum": None,
-        }
-    fernet = Fernet(settings.fernet_key)
+@lru_cache(maxsize=1)
+def _fernet(key: str):
+    # Fernet.__init__ base64-decodes and splits the key; the key is immutable
+    # so build the instance once. Tokens follow the Fernet spec, so the
+    # Rust-backed rfernet implementation is a drop-in when installed.
+    if RustFernet is not None:
+        return RustFernet(key)
+    return Fernet(key)
+
+
+@lru_cache(maxsize=8)
+def _decode_profile_features(
+    encrypted_payload: str, fernet_key: str, weekday: str
+) -> dict[str, str | None] | None:
+    """Decrypt and bucket a profile payload; cached because the profile rarely
+    changes between aggregation ticks (the token itself keys the cache, so a
+    profile update invalidates automatically)."""
+
+    fernet = _fernet(fernet_key)
     try:
-        decrypted = fernet.decrypt(profile.encrypted_payload.encode("utf-8"))
+        decrypted = fernet.decrypt(encrypted_payload.encode("utf-8"))
         data = json.loads(decrypted)
-    except (InvalidToken, ValueError, json.JSONDecodeError) as exc:
+    except (
+        InvalidToken,
+        RFernetDecryptionError,
+        ValueError,
+        json.JSONDecodeError,
+    ) as exc:
         logger.warning(
             "Skipping invalid profile payload", extra={"error": str(exc)}
         )
-        return {}
+        return None
     age = data.get("age", 35)
     if age < 25:
         age_bucket = "18-24"
@@ -55,8 +76,7 @@ def _load_profile_features(session: Session, settings) -> dict[str, str | None]:
     else:
         age_bucket = "65+"
     schedules = data.get("schedules", {})
-    now = datetime.utcnow()
-    user_state = schedules.get(now.strftime("%A"), "default")
+    user_state = schedules.get(weekday, "default")
     return {
         "age_bucket": age_bucket,
         "sex_enum": data.get("sex"),
@@ -66,17 +86,45 @@ def _load_profile_features(session: Session, settings) -> dict[str, str | None]:
     }
 
 
+def _load_profile_features(session: Session, settings) -> dict[str, str | None]:
+    row = (
+        session.query(ParticipantProfile.encrypted_payload)
+        .order_by(desc(ParticipantProfile.updated_at))
+        .first()
+    )
+    if not row:
+        return {
+            "age_bucket": None,
+            "sex_enum": None,
+            "impairment_enum": None,
+            "user_state": "default",
+            "chronotype_enum": None,
+        }
+    weekday = _WEEKDAY_NAMES[datetime.utcnow().weekday()]
+    features = _decode_profile_features(row[0], settings.fernet_key, weekday)
+    if features is None:
+        return {}
+    return dict(features)
+
+
+# Hour-of-day and weekday lookup tables: one tuple index instead of a branch
+# chain and locale-aware strftime formatting.
+_HOUR_TO_TOD = (
+    ("night",) * 6 + ("morning",) * 6 + ("day",) * 5 + ("evening",) * 4 + ("night",) * 3
+)
+_WEEKDAY_NAMES = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
+
 def _time_bucket(ts: datetime) -> Tuple[str, str]:
-    hour = ts.hour
-    if 6 <= hour < 12:
-        tod = "morning"
-    elif 12 <= hour < 17:
-        tod = "day"
-    elif 17 <= hour < 21:
-        tod = "evening"
-    else:
-        tod = "night"
-    return tod, ts.strftime("%A")
+    return _HOUR_TO_TOD[ts.hour], _WEEKDAY_NAMES[ts.weekday()]
 
 
 def aggregate_features(session: Session, window_minutes: int | None = None) -> FeatureRow | None:
@@ -85,26 +133,61 @@ def aggregate_features(session: Session, window_minutes: int | None = None) -> F
     window_end = datetime.utcnow()
     window_start = window_end - timedelta(minutes=window_minutes)
 
-    events = (
-        session.query(RawSensorEvent)
-        .filter(RawSensorEvent.timestamp >= window_start)
-        .order_by(asc(RawSensorEvent.timestamp))
-        .all()
-    )
-    if not events:
-        logger.debug("No sensor events available for feature aggregation")
-        return None
+    # Prefer the in-process ring buffer: ingest mirrors every reading into
+    # packed NumPy arrays, so the whole reduction is a few vectorized ops
+    # with no database round-trip. The ring declines (returns None) when it
+    # cannot cover the window, e.g. right after a restart.
+    ring_stats = get_sensor_ring().window_stats(window_start)
+    if ring_stats is not None:
+        (
+            event_count,
+            ambient_mean,
+            ambient_min,
+            ambient_max,
+            ambient_delta,
+            occupancy_rate,
+            occupancy_last,
+        ) = ring_stats
+    else:
+        # Cold-start fallback: one aggregate statement instead of an O(N) row
+        # fetch — the reductions run inside the database and only six scalars
+        # cross the connection.
+        in_window = RawSensorEvent.timestamp >= window_start
+        event_count, ambient_mean, ambient_min, ambient_max, occupancy_rate = (
+            session.query(
+                func.count(RawSensorEvent.id),
+                func.avg(RawSensorEvent.ambient_lux),
+                func.min(RawSensorEvent.ambient_lux),
+                func.max(RawSensorEvent.ambient_lux),
+                func.avg(case((RawSensorEvent.presence, 1), else_=0)),
+            )
+            .filter(in_window)
+            .one()
+        )
+        if not event_count:
+            logger.debug("No sensor events available for feature aggregation")
+            return None
 
-    lux_values = [event.ambient_lux for event in events]
-    occupancy_values = [1 if event.presence else 0 for event in events]
-    ambient_mean = float(mean(lux_values))
-    ambient_max = float(max(lux_values))
-    ambient_min = float(min(lux_values))
-    ambient_delta = (
-        float(lux_values[-1] - lux_values[0]) if len(lux_values) > 1 else 0.0
-    )
-    occupancy_rate = float(mean(occupancy_values))
-    occupancy_last = bool(events[-1].presence)
+        first_lux = (
+            session.query(RawSensorEvent.ambient_lux)
+            .filter(in_window)
+            .order_by(asc(RawSensorEvent.timestamp))
+            .limit(1)
+            .scalar()
+        )
+        last_lux, last_presence = (
+            session.query(RawSensorEvent.ambient_lux, RawSensorEvent.presence)
+            .filter(in_window)
+            .order_by(desc(RawSensorEvent.timestamp))
+            .limit(1)
+            .one()
+        )
+        ambient_mean = float(ambient_mean)
+        ambient_max = float(ambient_max)
+        ambient_min = float(ambient_min)
+        ambient_delta = float(last_lux - first_lux) if event_count > 1 else 0.0
+        occupancy_rate = float(occupancy_rate)
+        occupancy_last = bool(last_presence)
 
     weather = session.query(WeatherEvent).order_by(desc(WeatherEvent.timestamp)).first()
 
@@ -120,7 +203,9 @@ def aggregate_features(session: Session, window_minutes: int | None = None) -> F
         "time_of_day": time_of_day,
         "day_of_week": day_of_week,
     }
-    payload_bytes = len(json.dumps(payload).encode("utf-8"))
+    # Compact separators and no re-encode: json.dumps defaults to ASCII
+    # output, so the string length already equals the UTF-8 byte count.
+    payload_bytes = len(json.dumps(payload, separators=(",", ":")))
 
     feature_row = FeatureRow(
         window_start=window_start,
@@ -151,14 +236,34 @@ def aggregate_features(session: Session, window_minutes: int | None = None) -> F
     return feature_row
 
 
-def prepare_feature_windows(
+def prepare_feature_windows_with_latest(
     session: Session,
     rows: int | None = None,
-) -> List[dict[str, str | float | None]]:
+) -> Tuple[List[dict[str, str | float | None]], int | None]:
+    """Return feature windows plus the id of the newest row in the batch.
+
+    Callers that link decisions to the latest feature row can reuse this id
+    instead of issuing a second latest-row query.
+    """
+
     settings = get_settings()
     rows = rows or settings.feature_history_rows
+    # Select the needed columns as lightweight Row tuples; full ORM hydration
+    # (mapper instances, identity-map tracking) buys nothing here.
     query = (
-        session.query(FeatureRow)
+        session.query(
+            FeatureRow.id,
+            FeatureRow.age_bucket,
+            FeatureRow.sex_enum,
+            FeatureRow.impairment_enum,
+            FeatureRow.user_state,
+            FeatureRow.chronotype_enum,
+            FeatureRow.ambient_lux_mean,
+            FeatureRow.occupancy_rate,
+            FeatureRow.weather_summary,
+            FeatureRow.time_of_day,
+            FeatureRow.day_of_week,
+        )
         .order_by(desc(FeatureRow.created_at))
         .limit(rows)
     )
@@ -178,6 +283,15 @@ def prepare_feature_windows(
             "day_of_week": row.day_of_week,
         }
         windows.append(payload)
+    latest_id = feature_rows[-1].id if feature_rows else None
+    return windows, latest_id
+
+
+def prepare_feature_windows(
+    session: Session,
+    rows: int | None = None,
+) -> List[dict[str, str | float | None]]:
+    windows, _ = prepare_feature_windows_with_latest(session, rows)
     return windows
 
 
@@ -200,5 +314,6 @@ def get_active_override(session: Session) -> ManualOverride | None:
 __all__ = [
     "aggregate_features",
     "prepare_feature_windows",
+    "prepare_feature_windows_with_latest",
     "get_active_override",
 ]
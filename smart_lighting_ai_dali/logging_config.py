@@ -3,6 +3,11 @@ from __future__ import annotations
 import json
 import logging
 
+try:  # pragma: no cover - optional fast JSON serializer
+    import orjson
+except Exception:  # noqa: BLE001
+    orjson = None
+
 
 JSON_HANDLER_ATTR = "_smart_lighting_json_handler"
 
@@ -20,7 +25,9 @@ class JsonFormatter(logging.Formatter):
             extra = getattr(record, "extra")
             if isinstance(extra, dict):
                 data.update(extra)
-        return json.dumps(data)
+        if orjson is not None:
+            return orjson.dumps(data, default=str).decode()
+        return json.dumps(data, separators=(",", ":"), default=str)
 
 
 def configure_logging() -> None:
@@ -1,36 +1,46 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import time
 from pathlib import Path
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional
 
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from cryptography.fernet import Fernet, InvalidToken
-from fastapi import Depends, FastAPI, Header, HTTPException, Request, status
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy import text
+from sqlalchemy import insert, select, text
 from sqlalchemy.orm import Session
 
 from .config import Settings, get_settings
 from .control_service import ControlService
 from .dali import MockDALIController, TridonicUSBInterface
 from .db import Base, engine, get_db
-from .feature_engineering import aggregate_features, prepare_feature_windows
+from .feature_engineering import (
+    aggregate_features,
+    prepare_feature_windows_with_latest,
+)
 from .logging_config import configure_logging
 from .models import (
+    Counter,
     Decision,
     FeatureRow,
     ParticipantProfile,
     RawSensorEvent,
     WeatherEvent,
+    bump_counter,
 )
-from .openai_client import AIController, FeatureWindow
+from .openai_client import AIController, FeatureWindow, prewarm_openai_client
 from .rate_limit import InMemoryRateLimiter
 from .retention import prune_old_data
+from .sensor_ring import get_sensor_ring
 from .schemas import (
     ControlRequest,
     ControlResponse,
@@ -46,7 +56,24 @@ from .schemas import (
 
 logger = logging.getLogger(__name__)
 
-_LOGGING_CONFIGURED = False
+
+# create_all issues a reflection round-trip per table; run it once per
+# process, not once per create_app call.
+_SCHEMA_READY = False
+
+
+def reset_schema_cache() -> None:
+    """Force the next create_app to re-run metadata.create_all (test hook)."""
+
+    global _SCHEMA_READY
+    _SCHEMA_READY = False
+
+
+@lru_cache(maxsize=1)
+def _fernet(key: str) -> Fernet:
+    # The key is immutable for the process lifetime; reuse one Fernet rather
+    # than re-deriving the signing/encryption halves per app instance.
+    return Fernet(key)
 
 
 def create_app(
@@ -54,13 +81,14 @@ def create_app(
     *,
     use_mock_dali: bool | None = None,
 ) -> FastAPI:
-    global _LOGGING_CONFIGURED
-
     settings = settings or get_settings()
-    if not _LOGGING_CONFIGURED:
-        configure_logging()
-        _LOGGING_CONFIGURED = True
-    Base.metadata.create_all(bind=engine)
+    # configure_logging is self-idempotent (handler marker), so no module
+    # global is needed to avoid duplicate handlers.
+    configure_logging()
+    global _SCHEMA_READY
+    if not _SCHEMA_READY:
+        Base.metadata.create_all(bind=engine)
+        _SCHEMA_READY = True
     if use_mock_dali is None:
         use_mock_dali = settings.use_mock_dali
     dali = (
@@ -71,8 +99,10 @@ def create_app(
     control_service = ControlService(dali=dali, settings=settings)
     ai_controller = AIController(settings=settings, client=None)
     rate_limiter = InMemoryRateLimiter()
-    scheduler = BackgroundScheduler()
-    fernet = Fernet(settings.fernet_key)
+    # Scheduled on the application's event loop rather than a dedicated
+    # thread pool; the synchronous DB work is offloaded per tick below.
+    scheduler = AsyncIOScheduler()
+    fernet = _fernet(settings.fernet_key)
 
     def serialize_sensor_event(event: RawSensorEvent | None) -> dict[str, Any] | None:
         if not event:
@@ -97,15 +127,19 @@ def create_app(
             "manual_override_applied": bool(decision.manual_override_applied),
         }
 
-    def feature_job() -> None:
+    def _run_feature_job() -> None:
         with engine.begin() as connection:
             session = Session(bind=connection)
             try:
-                aggregate_features(session, settings.feature_window_minutes)
+                feature_row = aggregate_features(
+                    session, settings.feature_window_minutes
+                )
+                if feature_row is not None:
+                    app.state.latest_feature_row_id = feature_row.id
             finally:
                 session.close()
 
-    def retention_job() -> None:
+    def _run_retention_job() -> None:
         with engine.begin() as connection:
             session = Session(bind=connection)
             try:
@@ -113,6 +147,12 @@ def create_app(
             finally:
                 session.close()
 
+    async def feature_job() -> None:
+        await asyncio.to_thread(_run_feature_job)
+
+    async def retention_job() -> None:
+        await asyncio.to_thread(_run_retention_job)
+
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         # Startup: launch recurring jobs once FastAPI triggers the lifespan hook.
@@ -131,6 +171,14 @@ def create_app(
             )
             scheduler.start()
 
+        if settings.openai_api_key and ai_controller.client is not None:
+            # TLS pre-warm so the first /predict does not pay the handshake.
+            # The loop only keeps a weak reference to tasks, so park the
+            # handle on app.state lest the task be collected mid-flight.
+            app.state.prewarm_task = asyncio.create_task(
+                asyncio.to_thread(prewarm_openai_client, ai_controller.client)
+            )
+
         try:
             yield
         finally:
@@ -149,6 +197,9 @@ def create_app(
     app.state.logging_configured = True
     app.state.settings = settings
     app.state.fernet = fernet
+    # Writer-maintained cache of the newest feature row id; /control reads it
+    # instead of re-running a latest-row query per request.
+    app.state.latest_feature_row_id = None
 
     def require_admin_token(authorization: str | None = Header(None)) -> None:
         if not settings.admin_token:
@@ -167,40 +218,81 @@ def create_app(
 
     @app.post("/ingest/sensor", status_code=201)
     def ingest_sensor(payload: SensorIngest, db: Session = Depends(get_db)):
-        event = RawSensorEvent(
-            ambient_lux=payload.ambient_lux,
-            presence=payload.presence,
-            timestamp=payload.timestamp or datetime.utcnow(),
-        )
-        db.add(event)
+        # INSERT ... RETURNING gets the id in one round-trip; add/commit/
+        # refresh would re-SELECT the row on this throughput-bound path.
+        timestamp = payload.timestamp or datetime.utcnow()
+        event_id = db.execute(
+            insert(RawSensorEvent)
+            .values(
+                ambient_lux=payload.ambient_lux,
+                presence=payload.presence,
+                timestamp=timestamp,
+            )
+            .returning(RawSensorEvent.id)
+        ).scalar_one()
+        # The Core insert bypasses ORM events, so maintain the row counter
+        # explicitly inside the same transaction.
+        bump_counter(db.connection(), RawSensorEvent.__tablename__)
+        db.commit()
+        # Mirror into the in-process ring so aggregation can reduce over
+        # packed arrays; the DB row remains the durable copy.
+        get_sensor_ring().append(timestamp, payload.ambient_lux, payload.presence)
+        return {"id": event_id}
+
+    @app.post("/ingest/sensor/batch", status_code=201)
+    def ingest_sensor_batch(
+        payload: list[SensorIngest], db: Session = Depends(get_db)
+    ):
+        # One executemany INSERT and one commit for the whole batch instead
+        # of a transaction per event.
+        now = datetime.utcnow()
+        rows = [
+            {
+                "ambient_lux": event.ambient_lux,
+                "presence": event.presence,
+                "timestamp": event.timestamp or now,
+            }
+            for event in payload
+        ]
+        if rows:
+            db.execute(insert(RawSensorEvent), rows)
+            bump_counter(db.connection(), RawSensorEvent.__tablename__, len(rows))
         db.commit()
-        db.refresh(event)
-        return {"id": event.id}
+        ring = get_sensor_ring()
+        for row in rows:
+            ring.append(row["timestamp"], row["ambient_lux"], row["presence"])
+        return {"count": len(rows)}
 
     @app.post("/ingest/weather", status_code=201)
     def ingest_weather(payload: WeatherIngest, db: Session = Depends(get_db)):
-        event = WeatherEvent(
-            weather_summary=payload.weather_summary,
-            temperature_c=payload.temperature_c,
-            sunrise=payload.sunrise,
-            sunset=payload.sunset,
-            timestamp=payload.timestamp or datetime.utcnow(),
-        )
-        db.add(event)
+        event_id = db.execute(
+            insert(WeatherEvent)
+            .values(
+                weather_summary=payload.weather_summary,
+                temperature_c=payload.temperature_c,
+                sunrise=payload.sunrise,
+                sunset=payload.sunset,
+                timestamp=payload.timestamp or datetime.utcnow(),
+            )
+            .returning(WeatherEvent.id)
+        ).scalar_one()
         db.commit()
-        db.refresh(event)
-        return {"id": event.id}
+        return {"id": event_id}
 
     @app.post("/predict", response_model=PredictResponse)
     def predict(request: PredictRequest, db: Session = Depends(get_db)):
-        windows = prepare_feature_windows(db, rows=request.window_rows)
+        windows, latest_feature_row_id = prepare_feature_windows_with_latest(
+            db, rows=request.window_rows
+        )
         if not windows:
             return JSONResponse(
                 status_code=400, content={"detail": "No features available"}
             )
+        # One shared request timestamp: the value means "when the prediction
+        # ran", not "when the window was built".
+        now_iso = datetime.utcnow().isoformat()
         feature_windows = [
-            FeatureWindow(payload=window, timestamp=datetime.utcnow().isoformat())
-            for window in windows
+            FeatureWindow(payload=window, timestamp=now_iso) for window in windows
         ]
         try:
             setpoint, payload_size = ai_controller.compute_setpoint(feature_windows)
@@ -209,16 +301,15 @@ def create_app(
                 status_code=400,
                 content={"detail": str(exc)},
             )
-        feature_row = (
-            db.query(FeatureRow).order_by(FeatureRow.created_at.desc()).first()
-        )
+        # The windows query already visited the newest feature row; reuse its
+        # id instead of a second latest-row round-trip.
         decision = Decision(
             intensity=setpoint["intensity_0_100"],
             cct=setpoint["cct_1800_6500"],
             reason=setpoint["reason"],
             payload_bytes=payload_size,
             source="ai",
-            feature_row_id=feature_row.id if feature_row else None,
+            feature_row_id=latest_feature_row_id,
             manual_override_applied=False,
         )
         db.add(decision)
@@ -231,16 +322,24 @@ def create_app(
 
     @app.post("/control", response_model=ControlResponse)
     def control(payload: ControlRequest, db: Session = Depends(get_db)):
-        feature_row = (
-            db.query(FeatureRow).order_by(FeatureRow.created_at.desc()).first()
-        )
+        # Only the id is persisted on the decision; serve it from the cache
+        # the aggregation writers maintain, querying once to warm it.
+        feature_row_id = app.state.latest_feature_row_id
+        if feature_row_id is None:
+            feature_row_id = (
+                db.query(FeatureRow.id)
+                .order_by(FeatureRow.created_at.desc())
+                .limit(1)
+                .scalar()
+            )
+            app.state.latest_feature_row_id = feature_row_id
         decision = control_service.apply(
             db,
             intensity=payload.intensity,
             cct=payload.cct,
             reason=payload.reason,
             source=payload.source,
-            feature_row=feature_row,
+            feature_row_id=feature_row_id,
             manual_override=payload.manual_override,
             override_minutes=payload.override_minutes,
         )
@@ -253,13 +352,39 @@ def create_app(
         )
 
     @app.get("/telemetry", response_model=PaginatedTelemetry)
-    def telemetry(limit: int = 25, offset: int = 0, db: Session = Depends(get_db)):
-        query = db.query(Decision).order_by(Decision.decided_at.desc())
-        items = query.offset(offset).limit(limit).all()
-        total = query.count()
-        next_offset = offset + limit if offset + limit < total else None
+    def telemetry(
+        # ge=1 also keeps the has_more bookkeeping below safe: with a
+        # positive limit, has_more implies at least one item on the page.
+        limit: int = Query(25, ge=1),
+        offset: int = Query(0, ge=0),
+        cursor: datetime | None = None,
+        db: Session = Depends(get_db),
+    ):
+        stmt = select(
+            Decision.decided_at,
+            Decision.intensity,
+            Decision.cct,
+            Decision.reason,
+            Decision.source,
+            Decision.energy_saving_estimate,
+        ).order_by(Decision.decided_at.desc())
+        if cursor is not None:
+            # Keyset pagination: seek on the (decided_at, id) index instead of
+            # skipping `offset` rows.
+            stmt = stmt.where(Decision.decided_at < cursor)
+        else:
+            stmt = stmt.offset(offset)
+        # Fetch one extra row instead of a COUNT(*) table scan to decide
+        # whether another page exists.
+        rows = db.execute(stmt.limit(limit + 1)).all()
+        has_more = len(rows) > limit
+        items = rows[:limit]
+        next_offset = offset + limit if has_more and cursor is None else None
+        next_cursor = items[-1].decided_at if has_more else None
+        # Rows come from our own schema with the right types already;
+        # model_construct skips per-item validation on large pages.
         payload = [
-            TelemetryItem(
+            TelemetryItem.model_construct(
                 decided_at=item.decided_at,
                 intensity=item.intensity,
                 cct=item.cct,
@@ -272,18 +397,38 @@ def create_app(
         return PaginatedTelemetry(
             items=payload,
             next_offset=next_offset,
+            next_cursor=next_cursor,
             limit=limit,
         )
 
-    @app.get("/healthz", response_model=HealthStatus)
-    def healthz():
+    # Liveness probes hit /healthz every few seconds; cache the database
+    # round-trip so the real SELECT 1 runs at most once per interval.
+    _health_cache: dict[str, Any] = {"ts": None, "db": "unknown"}
+
+    def _probe_database() -> str:
         try:
             with engine.connect() as connection:
                 connection.execute(text("SELECT 1"))
-            db_status = "ok"
+            return "ok"
         except Exception as exc:  # noqa: BLE001
             logger.error("Database health check failed", extra={"error": str(exc)})
-            db_status = "error"
+            return "error"
+
+    @app.get("/healthz", response_model=HealthStatus)
+    async def healthz():
+        # Async handler: the cached path never leaves the event loop, and the
+        # occasional real probe is pushed to the threadpool explicitly
+        # instead of dispatching the whole request there.
+        now = time.monotonic()
+        if (
+            _health_cache["ts"] is not None
+            and now - _health_cache["ts"] < settings.health_cache_seconds
+        ):
+            db_status = _health_cache["db"]
+        else:
+            db_status = await asyncio.to_thread(_probe_database)
+            _health_cache["ts"] = now
+            _health_cache["db"] = db_status
         dali_status = control_service.dali.diagnostics().get("status", "unknown")
         scheduler_status = "running" if scheduler.running else "stopped"
         return HealthStatus(
@@ -327,8 +472,15 @@ def create_app(
         latest_decision = (
             db.query(Decision).order_by(Decision.decided_at.desc()).first()
         )
-        sensor_event_count = db.query(RawSensorEvent).count()
-        decision_count = db.query(Decision).count()
+        if settings.use_approx_counts:
+            # O(1) read of the maintained counters instead of two COUNT(*)
+            # scans over growing tables.
+            counts = dict(db.query(Counter.name, Counter.value).all())
+            sensor_event_count = counts.get(RawSensorEvent.__tablename__, 0)
+            decision_count = counts.get(Decision.__tablename__, 0)
+        else:
+            sensor_event_count = db.query(RawSensorEvent).count()
+            decision_count = db.query(Decision).count()
 
         return {
             "mode": mode,
@@ -343,15 +495,26 @@ def create_app(
 
     @app.post("/admin/aggregate-now", dependencies=[Depends(require_admin_token)])
     def aggregate_now(db: Session = Depends(get_db)):
-        aggregate_features(db, settings.feature_window_minutes)
+        feature_row = aggregate_features(db, settings.feature_window_minutes)
+        if feature_row is not None:
+            app.state.latest_feature_row_id = feature_row.id
         return {"ok": True}
 
+    # Profiles are read-mostly: cache the decoded payload per user so hot
+    # reads skip the DB round-trip and the Fernet decrypt. Writes invalidate
+    # below; the cap keeps the cache bounded on multi-user deployments.
+    _profile_cache: OrderedDict[str, dict[str, object]] = OrderedDict()
+    _profile_cache_max = 128
+
     @app.post("/profile", status_code=status.HTTP_201_CREATED)
     def upsert_profile(
         payload: ProfileSubmission, db: Session = Depends(get_db)
     ) -> dict[str, str]:
-        data = payload.model_dump()
-        encrypted = fernet.encrypt(json.dumps(data).encode("utf-8")).decode("utf-8")
+        # model_dump_json serializes straight from the validated model in
+        # Rust, skipping the intermediate dict + json.dumps pass.
+        encrypted = fernet.encrypt(payload.model_dump_json().encode("utf-8")).decode(
+            "utf-8"
+        )
         profile = (
             db.query(ParticipantProfile)
             .filter(ParticipantProfile.user_id == payload.user_id)
@@ -372,6 +535,7 @@ def create_app(
             db.add(profile)
             created = True
         db.commit()
+        _profile_cache.pop(payload.user_id, None)
         return {"status": "created" if created else "updated"}
 
     @app.get("/profile/{user_id}")
@@ -379,6 +543,10 @@ def create_app(
         user_id: str,
         db: Session = Depends(get_db),
     ) -> dict[str, object]:
+        cached = _profile_cache.get(user_id)
+        if cached is not None:
+            _profile_cache.move_to_end(user_id)
+            return dict(cached)
         profile = (
             db.query(ParticipantProfile)
             .filter(ParticipantProfile.user_id == user_id)
@@ -394,6 +562,9 @@ def create_app(
         data = json.loads(decrypted)
         data.setdefault("user_id", user_id)
         data["consent"] = bool(data.get("consent", True))
+        _profile_cache[user_id] = dict(data)
+        if len(_profile_cache) > _profile_cache_max:
+            _profile_cache.popitem(last=False)
         return data
 
     @app.delete(
@@ -414,6 +585,7 @@ def create_app(
             raise HTTPException(status_code=404, detail="Profile not found")
         db.delete(profile)
         db.commit()
+        _profile_cache.pop(user_id, None)
         return {"ok": True}
 
     frontend_dir = Path(__file__).resolve().parent / "frontend"
@@ -426,4 +598,4 @@ def create_app(
 app = create_app()
 
 
-__all__ = ["create_app", "app"]
+__all__ = ["create_app", "app", "reset_schema_cache"]
@@ -8,9 +8,14 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    event,
+    func,
+    insert,
+    update,
 )
 from sqlalchemy.orm import relationship
 
@@ -24,7 +29,27 @@ class RawSensorEvent(Base):
     timestamp = Column(DateTime, index=True, default=datetime.utcnow)
     ambient_lux = Column(Float, nullable=False)
     presence = Column(Boolean, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Retention prunes on created_at; keep it an index range scan. The
+    # server_default lets Core inserts omit the column entirely, skipping an
+    # app-side datetime allocation per row.
+    created_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        server_default=func.now(),
+        nullable=False,
+        index=True,
+    )
+
+    # Covering index so the window aggregation can be answered from index
+    # pages alone (INCLUDE applies on PostgreSQL; SQLite still gets the
+    # composite range index).
+    __table_args__ = (
+        Index(
+            "ix_rawsensor_ts_cover",
+            timestamp,
+            postgresql_include=["ambient_lux", "presence"],
+        ),
+    )
 
 
 class WeatherEvent(Base):
@@ -36,7 +61,13 @@ class WeatherEvent(Base):
     temperature_c = Column(Float, nullable=True)
     sunrise = Column(DateTime, nullable=True)
     sunset = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        server_default=func.now(),
+        nullable=False,
+        index=True,
+    )
 
 
 class PersonalProfile(Base):
@@ -81,7 +112,8 @@ class FeatureRow(Base):
     time_of_day = Column(String(16), nullable=False)
     day_of_week = Column(String(16), nullable=False)
     payload_size_estimate = Column(Integer, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Latest-row lookups and retention both order/filter on created_at.
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
 
     decisions = relationship("Decision", back_populates="feature_row")
 
@@ -102,23 +134,56 @@ class Decision(Base):
 
     feature_row = relationship("FeatureRow", back_populates="decisions")
 
+    # Composite ordering index so keyset pagination and latest-decision
+    # lookups are pure index seeks.
+    __table_args__ = (Index("ix_decision_decided_at_id", decided_at.desc(), id.desc()),)
+
 
 class Telemetry(Base):
     __tablename__ = "telemetry"
 
     id = Column(Integer, primary_key=True, index=True)
-    recorded_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    recorded_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
     metric = Column(String(64), nullable=False)
     value = Column(Float, nullable=True)
     detail = Column(Text, nullable=True)
 
 
+class Counter(Base):
+    """Per-table row counters so diagnostics can skip COUNT(*) scans."""
+
+    __tablename__ = "counters"
+
+    name = Column(String(64), primary_key=True)
+    value = Column(Integer, default=0, nullable=False)
+
+
+def bump_counter(connection, name: str, delta: int = 1) -> None:
+    """Adjust a named counter by ``delta`` within the caller's transaction.
+
+    One indexed UPDATE (plus a one-time INSERT for a new name) — cheap
+    enough for the write paths, O(1) to read back.
+    """
+
+    result = connection.execute(
+        update(Counter).where(Counter.name == name).values(value=Counter.value + delta)
+    )
+    if result.rowcount == 0:
+        connection.execute(insert(Counter).values(name=name, value=max(delta, 0)))
+
+
+@event.listens_for(Decision, "after_insert")
+def _count_decision_insert(mapper, connection, target):  # noqa: ANN001
+    bump_counter(connection, Decision.__tablename__)
+
+
 class ManualOverride(Base):
     __tablename__ = "manual_overrides"
 
     id = Column(Integer, primary_key=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    expires_at = Column(DateTime, nullable=False)
+    # Active-override lookups and retention both range-scan expires_at.
+    expires_at = Column(DateTime, nullable=False, index=True)
     intensity = Column(Integer, nullable=False)
     cct = Column(Integer, nullable=False)
     reason = Column(Text, nullable=True)
@@ -133,5 +198,7 @@ __all__ = [
     "FeatureRow",
     "Decision",
     "Telemetry",
+    "Counter",
     "ManualOverride",
+    "bump_counter",
 ]
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
+import random
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List
 
 try:  # pragma: no cover - import guard for optional dependency
@@ -15,25 +21,345 @@ except Exception:  # noqa: BLE001
         """Fallback OpenAI error when the SDK is unavailable."""
 
 
+import httpx
+import numpy as np
+from pydantic import BaseModel, ConfigDict, ValidationError, field_validator
+
+try:  # pragma: no cover - h2 enables HTTP/2 connection multiplexing
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except Exception:  # noqa: BLE001
+    _HTTP2 = False
+
+try:  # pragma: no cover - optional fast JSON serializer
+    import orjson
+except Exception:  # noqa: BLE001
+    orjson = None
+
+try:  # pragma: no cover - optional JIT compiler for the fallback rules
+    from numba import njit
+except Exception:  # noqa: BLE001
+    njit = None
+
 from .config import get_settings
 from .dali import clamp_cct, clamp_intensity
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Enum codes so the fallback kernel works on primitives instead of strings.
+# Request constants hoisted out of _call_openai: both are immutable per
+# process, so there is no reason to rebuild them per prediction.
+_SYSTEM_PROMPT = (
+    "You are a smart lighting controller optimizing comfort, "
+    "accessibility, and energy efficiency. Reply with a single JSON "
+    "object ONLY with keys: intensity_0_100 (int), cct_1800_6500 (int), reason (string)."
+)
+_RESPONSE_FORMAT = {"type": "json_object"}
+_SYSTEM_MESSAGE = {"role": "system", "content": _SYSTEM_PROMPT}
+
+_IMPAIRMENT_CODES = {"none": 0, "low_vision": 1, "photosensitive": 2}
+_DIM_WEATHER = frozenset({"overcast", "rain"})
+_TOD_CODES = {"day": 0, "morning": 1, "evening": 2, "night": 3}
+
+
+def _fallback_kernel(
+    ambient: float, occupancy: float, impairment: int, weather_dim: int, tod: int
+) -> tuple[int, int]:
+    """Rule ladder over primitive args; numba-compiled when available."""
+
+    if occupancy < 0.5:
+        intensity = 10
+    else:
+        base = 60 - int(ambient / 10)
+        base += 10 * (impairment == 1) - 15 * (impairment == 2)
+        base += 10 * weather_dim
+        base -= 5 * (tod >= 2)
+        intensity = max(20, base)
+    if impairment == 2:
+        cct = 3200
+    elif tod == 1:
+        cct = 5000
+    elif tod >= 2:
+        cct = 3000
+    else:
+        cct = 4000
+    return intensity, cct
+
+
+if njit is not None:  # pragma: no cover - exercised when numba is installed
+    _fallback_kernel = njit(cache=True)(_fallback_kernel)
+    # Warm the compile at import so the first real fallback is not a JIT hit.
+    _fallback_kernel(300.0, 1.0, 0, 0, 0)
+
+
+# slots drops the per-instance __dict__ (one FeatureWindow per window per
+# prediction); frozen documents that windows are read-only snapshots.
+@dataclass(slots=True, frozen=True)
 class FeatureWindow:
     payload: Dict[str, Any]
     timestamp: str
 
 
+# Lookup tables mirroring the scalar kernel's branches, indexed by the enum
+# codes above so the batch path is pure array arithmetic.
+_FALLBACK_IMPAIRMENT_ADJ = np.array([0, 10, -15], dtype=np.int64)
+_FALLBACK_CCT_BY_TOD = np.array([4000, 5000, 3000, 3000], dtype=np.int64)
+
+
+def fallback_batch(windows: List[FeatureWindow]) -> np.ndarray:
+    """Vectorized rule ladder over one window per zone/batch.
+
+    Returns an ``(n, 2)`` int array of ``(intensity, cct)`` rows, matching
+    :func:`_fallback_kernel` applied element-wise but touching each array
+    once instead of branching per window.
+    """
+
+    n = len(windows)
+    ambient = np.empty(n, dtype=np.float64)
+    occupancy = np.empty(n, dtype=np.float64)
+    impairment = np.empty(n, dtype=np.int64)
+    weather_dim = np.empty(n, dtype=np.int64)
+    tod = np.empty(n, dtype=np.int64)
+    for i, window in enumerate(windows):
+        payload = window.payload
+        ambient[i] = float(payload.get("ambient_lux", 300))
+        occupancy[i] = float(payload.get("occupancy", 0))
+        impairment[i] = _IMPAIRMENT_CODES.get(
+            payload.get("impairment_enum", "none"), 0
+        )
+        weather = (payload.get("weather_summary") or "clear").lower()
+        weather_dim[i] = 1 if weather in _DIM_WEATHER else 0
+        tod[i] = _TOD_CODES.get(payload.get("time_of_day", "day"), 0)
+
+    base = 60 - (ambient / 10).astype(np.int64)
+    base += _FALLBACK_IMPAIRMENT_ADJ[impairment]
+    base += 10 * weather_dim
+    base -= 5 * (tod >= 2)
+    intensity = np.where(occupancy < 0.5, 10, np.maximum(20, base))
+    cct = np.where(impairment == 2, 3200, _FALLBACK_CCT_BY_TOD[tod])
+    return np.stack(
+        [np.clip(intensity, 0, 100), np.clip(cct, 1800, 6500)], axis=1
+    )
+
+
+class SetpointResponse(BaseModel):
+    """Wire format of a model reply, validated in one pydantic-core pass.
+
+    ``model_validate_json`` parses and coerces in Rust without building an
+    intermediate dict; the before-validators keep the historical leniency
+    (numeric strings, fractional floats) that strict int coercion rejects.
+    Range clamping stays with the caller so out-of-range replies are
+    clamped rather than discarded.
+    """
+
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    intensity_0_100: int
+    cct_1800_6500: int
+    reason: str = "AI decision"
+
+    @field_validator("intensity_0_100", "cct_1800_6500", mode="before")
+    @classmethod
+    def _coerce_int(cls, value: Any) -> Any:
+        if isinstance(value, bool):
+            raise ValueError("boolean is not a valid setpoint")
+        if isinstance(value, str):
+            return int(float(value.strip()))
+        if isinstance(value, float):
+            return int(value)
+        return value
+
+    @field_validator("reason", mode="before")
+    @classmethod
+    def _coerce_reason(cls, value: Any) -> str:
+        if not isinstance(value, str):
+            value = str(value)
+        return (value or "AI decision")[:200]
+
+
+def _build_http_client() -> httpx.Client:
+    # Keep-alive pool (and HTTP/2 when h2 is installed) so repeated
+    # predictions reuse one TLS connection instead of re-handshaking.
+    return httpx.Client(
+        http2=_HTTP2,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        timeout=httpx.Timeout(10.0, connect=2.0),
+    )
+
+
+@lru_cache(maxsize=1)
+def _shared_openai_client(api_key: str):
+    # One client (and one transport pool) per process, shared by every
+    # AIController instance; the key is stable for the process lifetime.
+    return OpenAI(api_key=api_key, http_client=_build_http_client())
+
+
+def prewarm_openai_client(client) -> None:
+    """Establish the TCP+TLS connection before the first real prediction."""
+
+    try:
+        client.models.list()
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("OpenAI pre-warm failed", extra={"error": str(exc)})
+
+
+def _extract_text(response: Any) -> str | None:
+    """Pull the reply text out of whichever response shape the SDK returned.
+
+    The chat-completions shape is the hot path and short-circuits; the
+    rarer responses-API shapes share one try/except instead of per-level
+    hasattr probing.
+    """
+
+    # Fast path: chat.completions
+    try:
+        text = response.choices[0].message.content
+        if text:
+            return text.strip() or None
+    except (AttributeError, IndexError, TypeError):
+        pass
+
+    # responses-API convenience attribute
+    candidate = getattr(response, "output_text", None)
+    if isinstance(candidate, str) and candidate.strip():
+        return candidate.strip()
+
+    # responses-API block structure: output[0].content[0].text(.value)
+    try:
+        text_block = response.output[0].content[0].text
+    except (AttributeError, IndexError, TypeError):
+        return None
+    if isinstance(text_block, str):
+        return text_block.strip() or None
+    if text_block is not None:
+        return ((getattr(text_block, "value", "") or "").strip()) or None
+    return None
+
+
+class _TokenBucket:
+    """Blocking token bucket shaping outbound provider calls.
+
+    Spending a request costs one token; when empty, acquire() sleeps just
+    long enough for the next token instead of letting the provider answer
+    429 after a wasted round-trip.
+    """
+
+    def __init__(self, rate_per_s: float, burst: float) -> None:
+        self._rate = max(rate_per_s, 0.001)
+        self._burst = max(burst, 1.0)
+        self._tokens = self._burst
+        self._last = time.monotonic()
+
+    def acquire(self) -> None:
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._last) * self._rate
+            )
+            self._last = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return
+            time.sleep((1.0 - self._tokens) / self._rate)
+
+
+class _CircuitBreaker:
+    """CLOSED/OPEN/HALF_OPEN breaker so provider outages fail fast.
+
+    After ``threshold`` consecutive failures the breaker opens and callers
+    skip straight to the rules fallback for ``cooldown`` seconds; the first
+    call after the cool-down is a HALF_OPEN probe that either closes the
+    breaker or re-opens it immediately.
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0) -> None:
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = 0.0
+        self.state = "CLOSED"
+
+    def allow(self) -> bool:
+        if self.state == "OPEN":
+            if time.monotonic() - self.opened_at < self.cooldown:
+                return False
+            self.state = "HALF_OPEN"
+        return True
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == "HALF_OPEN" or self.failures >= self.threshold:
+            self.state = "OPEN"
+            self.opened_at = time.monotonic()
+            self.failures = 0
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.state = "CLOSED"
+
+
 class AIController:
     def __init__(self, settings=None, client: OpenAI | None = None) -> None:
         self.settings = settings or get_settings()
         self.client = client
         if self.client is None and self.settings.openai_api_key and OpenAI is not None:
-            self.client = OpenAI(api_key=self.settings.openai_api_key)
+            self.client = _shared_openai_client(self.settings.openai_api_key)
         self._ensure_chat_adapter()
+        # Two-tier setpoint cache: exact hash of the serialized payload, plus
+        # a coarse bucket over the latest window so near-identical states skip
+        # the network call entirely. Only successful model replies are stored.
+        self._exact_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._bucket_cache: OrderedDict[tuple, dict[str, Any]] = OrderedDict()
+        self._cache_max = 1024
+        self._breaker = _CircuitBreaker()
+        # Single-flight table: concurrent callers with an identical payload
+        # wait on the leader's Event instead of issuing duplicate API calls.
+        self._inflight: dict[str, threading.Event] = {}
+        self._inflight_lock = threading.Lock()
+        rpm = float(getattr(self.settings, "openai_rpm", 60))
+        self._bucket = _TokenBucket(rate_per_s=rpm / 60.0, burst=rpm / 60.0)
+        # Bind hot-path settings once: plain attribute reads on every
+        # prediction instead of repeated Pydantic descriptor lookups. The
+        # payload cap and batch limit stay live reads — operators (and the
+        # test suite) adjust them on a running controller.
+        self._model = getattr(self.settings, "openai_model", None) or "gpt-4o-mini"
+        self._reasoning = bool(
+            getattr(self.settings, "openai_enable_reasoning", False)
+        )
+
+    @staticmethod
+    def _bucket_key(latest: Dict[str, Any]) -> tuple:
+        ambient = latest.get("ambient_lux") or 0.0
+        occupancy = latest.get("occupancy") or 0.0
+        return (
+            round(ambient / 25) * 25,
+            round(occupancy * 4) / 4,
+            latest.get("impairment_enum"),
+            latest.get("weather_summary"),
+            latest.get("time_of_day"),
+        )
+
+    @staticmethod
+    def _retry_after_seconds(exc: Exception) -> float | None:
+        """Honor a Retry-After header when the provider sent one."""
+
+        headers = getattr(getattr(exc, "response", None), "headers", None)
+        if headers is None:
+            return None
+        try:
+            return float(headers.get("Retry-After"))
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+    def _cache_store(self, exact_key: str, bucket: tuple | None, result: dict) -> None:
+        for cache, key in ((self._exact_cache, exact_key), (self._bucket_cache, bucket)):
+            if key is None:
+                continue
+            cache[key] = result
+            cache.move_to_end(key)
+            if len(cache) > self._cache_max:
+                cache.popitem(last=False)
 
     def _ensure_chat_adapter(self) -> None:
         """
@@ -53,17 +379,29 @@ class AIController:
             # Attach a shim so we can call client.chat.completions.create(...)
             self.client.chat = _ChatWrapper(self.client.responses)  # type: ignore[attr-defined]
 
-    def _build_payload(self, features: Iterable[FeatureWindow]) -> dict[str, Any]:
+    def _build_payload(
+        self, features: Iterable[FeatureWindow]
+    ) -> tuple[dict[str, Any], str, int]:
+        """Serialize once and return ``(payload, payload_json, payload_size)``
+        so callers reuse the encoded string instead of re-dumping."""
+
         payload = {"windows": [fw.payload for fw in features]}
-        payload_json = json.dumps(payload)
-        payload_size = len(payload_json.encode("utf-8"))
+        if orjson is not None:
+            payload_bytes = orjson.dumps(payload)
+            payload_json = payload_bytes.decode()
+            payload_size = len(payload_bytes)
+        else:
+            payload_json = json.dumps(payload)
+            # json.dumps defaults to ASCII output, so the string length
+            # already equals the UTF-8 byte count.
+            payload_size = len(payload_json)
         if payload_size > self.settings.payload_cap_bytes:
             raise ValueError("Payload exceeds cap")
         if len(payload["windows"]) > self.settings.payload_batch_limit:
             raise ValueError("Too many feature windows")
-        return payload
+        return payload, payload_json, payload_size
 
-    def _call_openai(self, payload: dict[str, Any]) -> dict[str, Any]:
+    def _call_openai(self, payload: dict[str, Any] | str) -> dict[str, Any]:
         if not self.client:
             raise OpenAIError("OpenAI client not configured")
         self._ensure_chat_adapter()
@@ -73,143 +411,69 @@ class AIController:
         if completions_api is None or not hasattr(completions_api, "create"):
             raise OpenAIError("OpenAI client does not support chat completions")
 
+        # Shape the request on the way out so steady-state traffic never
+        # draws a 429 in the first place.
+        self._bucket.acquire()
+
         messages = [
+            _SYSTEM_MESSAGE,
+            # Accept a pre-serialized payload so the hot path serializes once.
             {
-                "role": "system",
-                "content": (
-                    "You are a smart lighting controller optimizing comfort, "
-                    "accessibility, and energy efficiency. Reply with a single JSON "
-                    "object ONLY with keys: intensity_0_100 (int), cct_1800_6500 (int), reason (string)."
-                ),
+                "role": "user",
+                "content": payload if isinstance(payload, str) else json.dumps(payload),
             },
-            {"role": "user", "content": json.dumps(payload)},
         ]
 
-        model = getattr(self.settings, "openai_model", None) or "gpt-4o-mini"
         request_args: dict[str, Any] = {
-            "model": model,
+            "model": self._model,
             "temperature": 0.2,
             "messages": messages,
         }
 
         # Ask for strict JSON if supported (Chat Completions accepts {"type": "json_object"})
-        request_args["response_format"] = {"type": "json_object"}
+        request_args["response_format"] = _RESPONSE_FORMAT
 
-        # Optional reasoning flag (avoid AttributeError if not in Settings)
-        if getattr(self.settings, "openai_enable_reasoning", False):
+        # Optional reasoning flag (absent from older Settings revisions)
+        if self._reasoning:
             request_args["reasoning"] = {"effort": "medium"}
 
         response = completions_api.create(**request_args)
 
-        # Try common shapes first (chat.completions)
-        text_payload: str | None = None
-        if hasattr(response, "choices"):
-            choices = getattr(response, "choices", None) or []
-            if choices:
-                message = getattr(choices[0], "message", None)
-                if message is not None:
-                    text_payload = (getattr(message, "content", "") or "").strip()
-
-        # Fallbacks for other SDK variants
-        if not text_payload and hasattr(response, "output_text"):
-            candidate = getattr(response, "output_text")
-            if isinstance(candidate, str):
-                text_payload = candidate.strip()
-
-        if not text_payload:
-            outputs = getattr(response, "output", None)
-            if outputs:
-                try:
-                    first_output = outputs[0]
-                except IndexError:
-                    first_output = None
-                if first_output is not None:
-                    content_items = getattr(first_output, "content", None)
-                    if content_items:
-                        try:
-                            first_item = content_items[0]
-                        except IndexError:
-                            first_item = None
-                        if first_item is not None:
-                            text_block = getattr(first_item, "text", None)
-                            if isinstance(text_block, str):
-                                text_payload = text_block.strip() or None
-                            elif text_block is not None:
-                                text_payload = ((getattr(text_block, "value", "") or "").strip()) or None
-
+        text_payload = _extract_text(response)
         if not text_payload:
             raise OpenAIError("Invalid response")
 
-        # Parse JSON strictly
+        # One pydantic-core pass: JSON decode, field coercion and the reason
+        # cap happen in Rust instead of a hand-rolled parse-and-check block.
         try:
-            data = json.loads(text_payload)
-        except json.JSONDecodeError as exc:
-            raise OpenAIError(f"Failed to decode JSON: {exc}") from exc
-
-        if not isinstance(data, dict):
-            raise OpenAIError("Response payload must be a JSON object")
-
-        # Coerce numbers safely, clamp, and validate reason
-        def _to_int(name: str, v: Any) -> int:
-            if isinstance(v, bool):
-                raise OpenAIError(f"Invalid boolean for {name}")
-            if isinstance(v, (int, float)):
-                return int(v)
-            if isinstance(v, str):
-                try:
-                    return int(float(v.strip()))
-                except Exception as exc:  # noqa: BLE001
-                    raise OpenAIError("Invalid numeric fields in response") from exc
-            raise OpenAIError("Invalid numeric fields in response")
-
-        try:
-            intensity = clamp_intensity(_to_int("intensity_0_100", data["intensity_0_100"]))
-            cct = clamp_cct(_to_int("cct_1800_6500", data["cct_1800_6500"]))
-        except (KeyError, OpenAIError) as exc:
-            raise OpenAIError("Invalid numeric fields in response") from exc
-
-        reason = data.get("reason")
-        if not isinstance(reason, str):
-            reason = str(reason)
-        reason = (reason or "AI decision")[:200]
+            parsed = SetpointResponse.model_validate_json(text_payload)
+        except ValidationError as exc:
+            raise OpenAIError(f"Invalid response payload: {exc}") from exc
 
         return {
-            "intensity_0_100": intensity,
-            "cct_1800_6500": cct,
-            "reason": reason,
+            "intensity_0_100": clamp_intensity(parsed.intensity_0_100),
+            "cct_1800_6500": clamp_cct(parsed.cct_1800_6500),
+            "reason": parsed.reason,
         }
 
     def fallback(self, features: Iterable[FeatureWindow]) -> dict[str, Any]:
         windows = list(features)
         latest = windows[-1].payload if windows else {}
-        ambient = latest.get("ambient_lux", 300)
-        occupancy = latest.get("occupancy", 0)
+        ambient = float(latest.get("ambient_lux", 300))
+        occupancy = float(latest.get("occupancy", 0))
         impairment = latest.get("impairment_enum", "none")
         weather = (latest.get("weather_summary") or "clear").lower()
         time_of_day = latest.get("time_of_day", "day")
 
-        if occupancy < 0.5:
-            intensity = 10
-        else:
-            base = 60 - int(ambient / 10)
-            if impairment == "low_vision":
-                base += 10
-            elif impairment == "photosensitive":
-                base -= 15
-            if weather in {"overcast", "rain"}:
-                base += 10
-            if time_of_day in {"evening", "night"}:
-                base -= 5
-            intensity = max(20, base)
-
-        if impairment == "photosensitive":
-            cct = 3200
-        elif time_of_day in {"morning"}:
-            cct = 5000
-        elif time_of_day in {"evening", "night"}:
-            cct = 3000
-        else:
-            cct = 4000
+        # Translate to primitives once, then run the (optionally compiled)
+        # branch-light kernel.
+        intensity, cct = _fallback_kernel(
+            ambient,
+            occupancy,
+            _IMPAIRMENT_CODES.get(impairment, 0),
+            1 if weather in _DIM_WEATHER else 0,
+            _TOD_CODES.get(time_of_day, 0),
+        )
 
         reason = "Fallback rules applied"
         return {
@@ -219,18 +483,69 @@ class AIController:
         }
 
     def compute_setpoint(self, features: List[FeatureWindow]) -> tuple[dict[str, Any], int]:
-        payload = self._build_payload(features)
-        payload_json = json.dumps(payload)
-        payload_size = len(payload_json.encode("utf-8"))
+        _, payload_json, payload_size = self._build_payload(features)
+        exact_key = hashlib.blake2b(
+            payload_json.encode(), digest_size=16
+        ).hexdigest()
+        cached = self._exact_cache.get(exact_key)
+        if cached is not None:
+            self._exact_cache.move_to_end(exact_key)
+            return dict(cached), payload_size
+        bucket = self._bucket_key(features[-1].payload) if features else None
+        if bucket is not None:
+            cached = self._bucket_cache.get(bucket)
+            if cached is not None:
+                self._bucket_cache.move_to_end(bucket)
+                return dict(cached), payload_size
+        while True:
+            with self._inflight_lock:
+                leader = self._inflight.get(exact_key)
+                if leader is None:
+                    self._inflight[exact_key] = threading.Event()
+                    break
+            # Identical request already in flight: wait for its result and
+            # serve it from the exact cache instead of a duplicate call.
+            leader.wait(timeout=30.0)
+            cached = self._exact_cache.get(exact_key)
+            if cached is not None:
+                return dict(cached), payload_size
+            # Leader ended without caching (error path); take over as leader.
+        try:
+            return self._compute_uncached(
+                features, payload_json, payload_size, exact_key, bucket
+            )
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(exact_key).set()
+
+    def _compute_uncached(
+        self,
+        features: List[FeatureWindow],
+        payload_json: str,
+        payload_size: int,
+        exact_key: str,
+        bucket: tuple | None,
+    ) -> tuple[dict[str, Any], int]:
+        if not self._breaker.allow():
+            # Provider is known-bad; skip the retry loop (and its backoff)
+            # entirely until the breaker cool-down elapses.
+            logger.warning("OpenAI circuit open; using rules fallback")
+            return self.fallback(features), payload_size
         attempts = 0
+        # Decorrelated-jitter backoff state (base 0.25s, cap 8s) so retrying
+        # controllers do not synchronize against the provider.
+        prev_delay = 0.25
         while attempts < 3:
             attempts += 1
             try:
-                result = self._call_openai(payload)
+                result = self._call_openai(payload_json)
                 result["intensity_0_100"] = clamp_intensity(result["intensity_0_100"])
                 result["cct_1800_6500"] = clamp_cct(result["cct_1800_6500"])
+                self._breaker.record_success()
+                self._cache_store(exact_key, bucket, dict(result))
                 return result, payload_size
             except Exception as exc:  # noqa: BLE001
+                self._breaker.record_failure()
                 if attempts == 1:
                     logger.error(
                         "OpenAI call failed (%s): %s",
@@ -243,9 +558,50 @@ class AIController:
                         "OpenAI call failed, retrying",
                         extra={"error": str(exc), "attempt": attempts},
                     )
-                time.sleep(0.5 * attempts)
+                status_code = getattr(exc, "status_code", None)
+                if (
+                    isinstance(status_code, int)
+                    and 400 <= status_code < 500
+                    and status_code != 429
+                ):
+                    # Terminal client error (bad request, auth, ...): retrying
+                    # cannot succeed, go straight to the fallback.
+                    break
+                if not self._breaker.allow():
+                    # Breaker tripped mid-loop (e.g. a failed HALF_OPEN
+                    # probe); stop retrying immediately.
+                    break
+                if attempts < 3:
+                    # No backoff after the final attempt: fall through to the
+                    # rules controller immediately instead of sleeping first.
+                    delay = self._retry_after_seconds(exc)
+                    if delay is None:
+                        delay = min(8.0, random.uniform(0.25, prev_delay * 3))
+                    prev_delay = delay
+                    time.sleep(delay)
         logger.error("Falling back to rules controller")
         return self.fallback(features), payload_size
 
+    async def compute_setpoints(
+        self, batches: List[List[FeatureWindow]]
+    ) -> List[tuple[dict[str, Any], int] | BaseException]:
+        """Compute setpoints for several zones concurrently.
+
+        Each batch runs the normal sync pipeline on the threadpool; the
+        requests overlap on I/O, so N zones cost roughly one round-trip of
+        wall time instead of N. Failures come back as exceptions in the
+        result list rather than aborting the gather.
+        """
+
+        return await asyncio.gather(
+            *(asyncio.to_thread(self.compute_setpoint, batch) for batch in batches),
+            return_exceptions=True,
+        )
+
 
-__all__ = ["AIController", "FeatureWindow"]
+__all__ = [
+    "AIController",
+    "FeatureWindow",
+    "fallback_batch",
+    "prewarm_openai_client",
+]
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 import time
-from collections import defaultdict, deque
-from typing import Deque
+from functools import lru_cache
 
 from fastapi import HTTPException, Request, status
 
@@ -10,27 +9,60 @@ from .config import get_settings
 
 
 class InMemoryRateLimiter:
+    """Token-bucket limiter: O(1) per request with in-place bucket updates.
+
+    Each client holds a mutable ``[tokens, last_refill]`` pair; a check is
+    one dict lookup, one multiply and two assignments — no deque churn or
+    per-request allocation like the previous sliding-window log.
+    """
+
     def __init__(self) -> None:
         self.settings = get_settings()
-        self.requests: dict[str, Deque[float]] = defaultdict(deque)
+        self._capacity = float(self.settings.rate_limit_requests)
+        self._refill_per_s = self._capacity / float(
+            self.settings.rate_limit_window_seconds
+        )
+        self._buckets: dict[str, list[float]] = {}
+        self._max_clients = 10_000
+
+    def _evict_idle(self, now: float) -> None:
+        # A bucket idle for a full window has refilled completely, so
+        # dropping it is lossless; only runs when the client table is full.
+        window = float(self.settings.rate_limit_window_seconds)
+        stale = [
+            identifier
+            for identifier, bucket in self._buckets.items()
+            if now - bucket[1] > window
+        ]
+        for identifier in stale:
+            del self._buckets[identifier]
 
     def check(self, request: Request) -> None:
         identifier = request.client.host if request.client else "unknown"
-        window = self.settings.rate_limit_window_seconds
-        limit = self.settings.rate_limit_requests
-        now = time.time()
-        queue = self.requests[identifier]
-        while queue and now - queue[0] > window:
-            queue.popleft()
-        if len(queue) >= limit:
+        now = time.monotonic()
+        bucket = self._buckets.get(identifier)
+        if bucket is None:
+            if len(self._buckets) >= self._max_clients:
+                self._evict_idle(now)
+            self._buckets[identifier] = [self._capacity - 1.0, now]
+            return
+        tokens = min(
+            self._capacity, bucket[0] + (now - bucket[1]) * self._refill_per_s
+        )
+        bucket[1] = now
+        if tokens < 1.0:
+            bucket[0] = tokens
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail="Rate limit exceeded",
             )
-        queue.append(now)
+        bucket[0] = tokens - 1.0
 
 
+@lru_cache(maxsize=1)
 def get_rate_limiter() -> InMemoryRateLimiter:
+    # A fresh limiter per call would start with empty buckets and enforce
+    # nothing; hand every caller the same process-wide instance.
     return InMemoryRateLimiter()
 
 
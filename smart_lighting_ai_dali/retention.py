@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
 
 from .config import get_settings
@@ -12,59 +13,77 @@ from .models import (
     RawSensorEvent,
     Telemetry,
     WeatherEvent,
+    bump_counter,
 )
 
 
+# Per-batch row cap: bounds transaction size, lock duration and WAL growth
+# when retention first runs against a long-lived table.
+_DELETE_BATCH_SIZE = 10_000
+
+
+def _delete_in_batches(session: Session, model, predicate) -> int:
+    deleted = 0
+    while True:
+        ids = [
+            row[0]
+            for row in session.query(model.id)
+            .filter(predicate)
+            .limit(_DELETE_BATCH_SIZE)
+            .all()
+        ]
+        if not ids:
+            return deleted
+        # Core delete: nothing is loaded into the identity map, so memory
+        # stays flat regardless of batch count.
+        result = session.execute(
+            delete(model)
+            .where(model.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+        deleted += result.rowcount or 0
+        # Commit per batch so inserts are never blocked for the whole prune.
+        session.commit()
+
+
 def prune_old_data(session: Session) -> dict[str, int]:
     settings = get_settings()
     now = datetime.utcnow()
-    counts = {
-        "raw": 0,
-        "features": 0,
-        "decisions": 0,
-        "telemetry": 0,
-        "weather": 0,
-        "overrides": 0,
-    }
 
     raw_threshold = now - timedelta(days=settings.retention_raw_days)
-    counts["raw"] = (
-        session.query(RawSensorEvent)
-        .filter(RawSensorEvent.created_at < raw_threshold)
-        .delete()
-    )
-
     feature_threshold = now - timedelta(days=settings.retention_feature_days)
-    counts["features"] = (
-        session.query(FeatureRow)
-        .filter(FeatureRow.created_at < feature_threshold)
-        .delete()
-    )
-
     decision_threshold = now - timedelta(days=settings.retention_decision_days)
-    counts["decisions"] = (
-        session.query(Decision)
-        .filter(Decision.decided_at < decision_threshold)
-        .delete()
+    override_threshold = now - timedelta(
+        seconds=settings.retention_override_grace_seconds
     )
 
-    counts["telemetry"] = (
-        session.query(Telemetry)
-        .filter(Telemetry.recorded_at < decision_threshold)
-        .delete()
-    )
-    counts["weather"] = (
-        session.query(WeatherEvent)
-        .filter(WeatherEvent.created_at < feature_threshold)
-        .delete()
-    )
-    override_grace = timedelta(seconds=settings.retention_override_grace_seconds)
-    override_threshold = now - override_grace
-    counts["overrides"] = (
-        session.query(ManualOverride)
-        .filter(ManualOverride.expires_at < override_threshold)
-        .delete()
-    )
+    counts = {
+        "raw": _delete_in_batches(
+            session, RawSensorEvent, RawSensorEvent.created_at < raw_threshold
+        ),
+        "features": _delete_in_batches(
+            session, FeatureRow, FeatureRow.created_at < feature_threshold
+        ),
+        "decisions": _delete_in_batches(
+            session, Decision, Decision.decided_at < decision_threshold
+        ),
+        "telemetry": _delete_in_batches(
+            session, Telemetry, Telemetry.recorded_at < decision_threshold
+        ),
+        "weather": _delete_in_batches(
+            session, WeatherEvent, WeatherEvent.created_at < feature_threshold
+        ),
+        "overrides": _delete_in_batches(
+            session, ManualOverride, ManualOverride.expires_at < override_threshold
+        ),
+    }
+    # Bulk deletes bypass ORM events; keep the diagnostics counters honest.
+    if counts["raw"]:
+        bump_counter(session.connection(), RawSensorEvent.__tablename__, -counts["raw"])
+    if counts["decisions"]:
+        bump_counter(
+            session.connection(), Decision.__tablename__, -counts["decisions"]
+        )
     session.commit()
     return counts
 
@@ -1,23 +1,73 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List
+from functools import lru_cache
+from typing import Annotated, List, Literal
+
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    field_validator,
+    model_validator,
+)
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def _fast_datetime(value: object) -> object:
+    # JSON bodies deliver timestamps as ISO strings; fromisoformat is the C
+    # fast path and the cache absorbs bursts that repeat the same second.
+    # Anything it cannot parse falls through to pydantic's generic validator
+    # so non-ISO inputs keep their usual error messages.
+    if isinstance(value, str):
+        try:
+            return _parse_iso(value)
+        except ValueError:
+            return value
+    return value
+
+
+FastDatetime = Annotated[datetime, BeforeValidator(_fast_datetime)]
+
+# Closed vocabularies produced by the feature pipeline's own lookup tables;
+# Literal compiles to an interned-string compare in pydantic-core, which is
+# cheaper than free-form str validation on the predict path.
+AgeBucket = Literal["18-24", "25-44", "45-64", "65+"]
+TimeOfDay = Literal["night", "morning", "day", "evening"]
+DayOfWeek = Literal[
+    "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"
+]
+
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+# Shared configs: these models are pure data carriers that are read once
+# and never mutated, so freezing them drops the assignment-validation hooks;
+# the ingest models additionally reject unknown fields at the edge instead
+# of silently discarding them.
+_INGEST_CONFIG = ConfigDict(frozen=True, extra="forbid")
+_RESPONSE_CONFIG = ConfigDict(frozen=True)
 
 
 class SensorIngest(BaseModel):
+    model_config = _INGEST_CONFIG
+
     ambient_lux: float = Field(..., ge=0, le=1000)
     presence: bool
-    timestamp: datetime | None = None
+    timestamp: FastDatetime | None = None
 
 
 class WeatherIngest(BaseModel):
+    model_config = _INGEST_CONFIG
+
     weather_summary: str
     temperature_c: float | None = None
-    sunrise: datetime | None = None
-    sunset: datetime | None = None
-    timestamp: datetime | None = None
+    sunrise: FastDatetime | None = None
+    sunset: FastDatetime | None = None
+    timestamp: FastDatetime | None = None
 
 
 class PredictRequest(BaseModel):
@@ -25,6 +75,8 @@ class PredictRequest(BaseModel):
 
 
 class AISetpoint(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     intensity_0_100: int = Field(..., ge=0, le=100)
     cct_1800_6500: int = Field(..., ge=1800, le=6500)
     reason: str
@@ -46,6 +98,8 @@ class ControlRequest(BaseModel):
 
 
 class ControlResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     applied: bool
     intensity: int
     cct: int
@@ -54,6 +108,10 @@ class ControlResponse(BaseModel):
 
 
 class TelemetryItem(BaseModel):
+    # Validate straight off ORM rows / Row tuples without a per-item
+    # keyword-argument dict.
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     decided_at: datetime
     intensity: int
     cct: int
@@ -63,12 +121,19 @@ class TelemetryItem(BaseModel):
 
 
 class PaginatedTelemetry(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     items: List[TelemetryItem]
     next_offset: int | None
+    # Keyset cursor: pass back as ?cursor=... to continue from the last item
+    # with an index seek instead of an OFFSET scan.
+    next_cursor: datetime | None = None
     limit: int
 
 
 class ManualOverrideStatus(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     active: bool
     expires_at: datetime | None
     intensity: int | None
@@ -77,6 +142,8 @@ class ManualOverrideStatus(BaseModel):
 
 
 class HealthStatus(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     status: str
     database: str
     dali: str
@@ -84,7 +151,9 @@ class HealthStatus(BaseModel):
 
 
 class FeaturePayload(BaseModel):
-    age_bucket: str | None
+    model_config = _RESPONSE_CONFIG
+
+    age_bucket: AgeBucket | None
     sex_enum: str | None
     impairment_enum: str | None
     user_state: str | None
@@ -92,11 +161,13 @@ class FeaturePayload(BaseModel):
     ambient_lux: float
     occupancy: float
     weather_summary: str | None
-    time_of_day: str
-    day_of_week: str
+    time_of_day: TimeOfDay
+    day_of_week: DayOfWeek
 
 
 class PredictResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     setpoint: AISetpoint
     payload_bytes: int
     features_used: int
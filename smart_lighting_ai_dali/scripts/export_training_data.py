@@ -1,13 +1,9 @@
 from __future__ import annotations
 
 import argparse
+import csv
 from pathlib import Path
 
-import pandas as pd
-
-from smart_lighting_ai_dali.db import SessionLocal
-from smart_lighting_ai_dali.models import Decision, FeatureRow
-
 
 EXPORT_COLUMNS = [
     "timestamp",
@@ -21,41 +17,122 @@ EXPORT_COLUMNS = [
     "cct",
 ]
 
+# Rows fetched (and written) per batch; bounds peak memory for large tables.
+_BATCH_ROWS = 10_000
 
-def export_csv(path: Path) -> None:
-    with SessionLocal() as session:  # type: ignore[call-arg]
-        rows = (
-            session.query(FeatureRow, Decision)
-            .outerjoin(Decision, Decision.feature_row_id == FeatureRow.id)
-            .order_by(FeatureRow.window_end.desc())
-            .all()
+
+def _arrow_schema():
+    # Explicit Arrow schema: dictionary encoding for the low-cardinality
+    # string columns and int32 for the setpoints, instead of the float64
+    # pandas infers when NULLs are present.
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("timestamp", pa.string()),
+            ("ambient_lux_mean", pa.float64()),
+            ("ambient_lux_delta", pa.float64()),
+            ("occupancy_rate", pa.float64()),
+            ("weather_summary", pa.dictionary(pa.int32(), pa.string())),
+            ("age_bucket", pa.dictionary(pa.int32(), pa.string())),
+            ("impairment_enum", pa.dictionary(pa.int32(), pa.string())),
+            ("intensity", pa.int32()),
+            ("cct", pa.int32()),
+        ]
+    )
+
+
+def export_csv(path: Path, output_format: str = "both") -> None:
+    """Stream the joined feature/decision rows to Parquet and/or CSV.
+
+    Rows arrive in server-side batches of ``_BATCH_ROWS`` and each batch is
+    written before the next is fetched, so peak memory is O(batch) rather
+    than O(table) and there is no intermediate DataFrame. CSV is by far the
+    most expensive output to produce, so ``output_format`` lets callers who
+    only need the columnar file skip it entirely.
+    """
+
+    # Imported lazily so --help does not pay for the pyarrow/sqlalchemy
+    # import graph.
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from sqlalchemy import select
+
+    from smart_lighting_ai_dali.db import SessionLocal
+    from smart_lighting_ai_dali.models import Decision, FeatureRow
+
+    write_csv = output_format in ("csv", "both")
+    write_parquet = output_format in ("parquet", "both")
+    schema = _arrow_schema() if write_parquet else None
+
+    # Project the nine columns directly: the driver hands back plain tuples
+    # with no ORM hydration, identity map or per-attribute descriptor cost.
+    stmt = (
+        select(
+            FeatureRow.window_end,
+            FeatureRow.ambient_lux_mean,
+            FeatureRow.ambient_lux_delta,
+            FeatureRow.occupancy_rate,
+            FeatureRow.weather_summary,
+            FeatureRow.age_bucket,
+            FeatureRow.impairment_enum,
+            Decision.intensity,
+            Decision.cct,
         )
-        data = []
-        for feature, decision in rows:
-            data.append(
-                {
-                    "timestamp": feature.window_end.isoformat(),
-                    "ambient_lux_mean": feature.ambient_lux_mean,
-                    "ambient_lux_delta": feature.ambient_lux_delta,
-                    "occupancy_rate": feature.occupancy_rate,
-                    "weather_summary": feature.weather_summary,
-                    "age_bucket": feature.age_bucket,
-                    "impairment_enum": feature.impairment_enum,
-                    "intensity": decision.intensity if decision else None,
-                    "cct": decision.cct if decision else None,
-                }
+        .outerjoin(Decision, Decision.feature_row_id == FeatureRow.id)
+        .order_by(FeatureRow.window_end.desc())
+        .execution_options(yield_per=_BATCH_ROWS)
+    )
+    parquet_path = path.with_suffix(".parquet")
+    total = 0
+    with SessionLocal() as session:  # type: ignore[call-arg]
+        csv_file = open(path, "w", newline="") if write_csv else None
+        parquet_writer = (
+            pq.ParquetWriter(
+                parquet_path, schema, compression="zstd", compression_level=3
             )
-        df = pd.DataFrame(data)
-        if not df.empty:
-            df = df[EXPORT_COLUMNS]
-        df.to_csv(path, index=False)
-        parquet_path = path.with_suffix(".parquet")
-        df.to_parquet(parquet_path, index=False)
-        print(f"Exported {len(df)} rows to {path} and {parquet_path}")
+            if write_parquet
+            else None
+        )
+        try:
+            csv_writer = None
+            if csv_file is not None:
+                csv_writer = csv.writer(csv_file)
+                csv_writer.writerow(EXPORT_COLUMNS)
+            for partition in session.execute(stmt).partitions():
+                rows = [
+                    (window_end.isoformat(), *rest)
+                    for window_end, *rest in partition
+                ]
+                if parquet_writer is not None:
+                    columns = dict(zip(EXPORT_COLUMNS, zip(*rows)))
+                    parquet_writer.write_table(
+                        pa.Table.from_pydict(columns, schema=schema)
+                    )
+                if csv_writer is not None:
+                    csv_writer.writerows(rows)
+                total += len(rows)
+        finally:
+            if parquet_writer is not None:
+                parquet_writer.close()
+            if csv_file is not None:
+                csv_file.close()
+    targets = [
+        str(target)
+        for target, enabled in ((path, write_csv), (parquet_path, write_parquet))
+        if enabled
+    ]
+    print(f"Exported {total} rows to {' and '.join(targets)}")
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("output", help="Output CSV path")
+    parser.add_argument(
+        "--format",
+        choices=("parquet", "csv", "both"),
+        default="parquet",
+        help="Output format(s) to write (default: parquet; CSV is the slowest)",
+    )
     args = parser.parse_args()
-    export_csv(Path(args.output))
+    export_csv(Path(args.output), output_format=args.format)
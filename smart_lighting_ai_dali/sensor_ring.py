@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import threading
+from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
+
+try:  # pragma: no cover - optional JIT compiler for the reduction loop
+    from numba import njit
+except Exception:  # noqa: BLE001
+    njit = None
+
+from .config import get_settings
+
+
+if njit is not None:
+    # One fused pass keeps the buffer in cache instead of the four separate
+    # traversals chained NumPy reductions perform; this matters on the
+    # Raspberry Pi class hardware the controller targets.
+    @njit(cache=True, fastmath=True)
+    def _fused_reduce(lux, presence):  # pragma: no cover - exercised when installed
+        mn = mx = lux[0]
+        total = 0.0
+        present = 0.0
+        for i in range(lux.size):
+            value = lux[i]
+            total += value
+            if value < mn:
+                mn = value
+            if value > mx:
+                mx = value
+            present += presence[i]
+        n = lux.size
+        return total / n, mn, mx, lux[-1] - lux[0], present / n
+
+else:
+
+    def _fused_reduce(
+        lux: np.ndarray, presence: np.ndarray
+    ) -> tuple[float, float, float, float, float]:
+        return (
+            float(lux.mean()),
+            float(lux.min()),
+            float(lux.max()),
+            float(lux[-1] - lux[0]),
+            float(presence.mean()),
+        )
+
+
+class SensorRing:
+    """Fixed-size structure-of-arrays ring buffer of sensor readings.
+
+    Ingest appends each reading here as well as to the database; feature
+    aggregation can then reduce over contiguous NumPy columns instead of
+    hydrating one ORM row per event. The database remains the source of
+    truth for retention and for windows the ring does not cover yet
+    (e.g. right after a restart).
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = max(1, int(capacity))
+        self._timestamps = np.zeros(self.capacity, dtype=np.float64)
+        self._lux = np.zeros(self.capacity, dtype=np.float32)
+        self._presence = np.zeros(self.capacity, dtype=np.uint8)
+        self._head = 0
+        self._size = 0
+        self._started_at = datetime.utcnow()
+        self._lock = threading.Lock()
+
+    def append(self, timestamp: datetime, ambient_lux: float, presence: bool) -> None:
+        with self._lock:
+            self._timestamps[self._head] = timestamp.timestamp()
+            self._lux[self._head] = ambient_lux
+            self._presence[self._head] = 1 if presence else 0
+            self._head = (self._head + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+
+    def covers(self, window_start: datetime) -> bool:
+        """Whether the ring has seen every event since ``window_start``."""
+
+        if self._started_at > window_start:
+            return False
+        if self._size == self.capacity:
+            with self._lock:
+                oldest = float(self._timestamps.min())
+            if oldest > window_start.timestamp():
+                return False
+        return True
+
+    def window_stats(
+        self, window_start: datetime
+    ) -> tuple[int, float, float, float, float, float, bool] | None:
+        """Reduce the window in-memory.
+
+        Returns ``(count, mean, min, max, delta, occupancy_rate,
+        occupancy_last)`` or ``None`` when the ring cannot answer for the
+        requested window. An empty window also yields ``None`` so callers
+        consult the database, which may hold rows written outside the
+        ingest path.
+        """
+
+        if not self.covers(window_start):
+            return None
+        with self._lock:
+            size = self._size
+            if size == 0:
+                return None
+            # Chronological view of the valid region.
+            if size == self.capacity:
+                order = np.arange(self._head, self._head + size) % self.capacity
+                timestamps = self._timestamps[order]
+                lux = self._lux[order]
+                presence = self._presence[order]
+            else:
+                timestamps = self._timestamps[:size]
+                lux = self._lux[:size]
+                presence = self._presence[:size]
+            mask = timestamps >= window_start.timestamp()
+            lux = lux[mask]
+            presence = presence[mask]
+        count = int(lux.size)
+        if count == 0:
+            return None
+        mean, minimum, maximum, delta, occupancy_rate = _fused_reduce(lux, presence)
+        return (
+            count,
+            float(mean),
+            float(minimum),
+            float(maximum),
+            float(delta),
+            float(occupancy_rate),
+            bool(presence[-1]),
+        )
+
+
+@lru_cache(maxsize=1)
+def get_sensor_ring() -> SensorRing:
+    settings = get_settings()
+    # Twice the feature window at a 1 Hz sensor rate.
+    return SensorRing(capacity=settings.feature_window_minutes * 60 * 2)
+
+
+__all__ = ["SensorRing", "get_sensor_ring"]
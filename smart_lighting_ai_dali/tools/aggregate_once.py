@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import sys
 
-from ..config import get_settings
-from ..db import session_scope
-from ..feature_engineering import aggregate_features
-
 
 def main() -> int:
     """Aggregate a single set of features and report the outcome."""
+    # Imported lazily so a one-shot invocation (or --help) does not pay for
+    # the package's pydantic/sqlalchemy import graph until it actually runs.
+    from ..config import get_settings
+    from ..db import session_scope
+    from ..feature_engineering import aggregate_features
+
     settings = get_settings()
     try:
         with session_scope() as session:
@@ -3,12 +3,14 @@ from __future__ import annotations
 import json
 import os
 import tempfile
+from datetime import datetime, timedelta
 from importlib import reload
 from pathlib import Path
 from typing import Generator
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import insert
 
 TEST_FERNET_KEY = "3hWrYIogeMKAoBFoQVoM23bzb1bqGTGSQhZWWSWxMgI="
 
@@ -29,7 +31,9 @@ from smart_lighting_ai_dali import db  # noqa: E402
 reload(db)
 
 from smart_lighting_ai_dali.db import Base, engine, SessionLocal  # noqa: E402
+from smart_lighting_ai_dali.feature_engineering import aggregate_features  # noqa: E402
 from smart_lighting_ai_dali.main import create_app  # noqa: E402
+from smart_lighting_ai_dali.sensor_ring import get_sensor_ring  # noqa: E402
 from smart_lighting_ai_dali.models import (  # noqa: E402
     Decision,
     FeatureRow,
@@ -86,8 +90,11 @@ def app(session):  # noqa: ANN001
         pass
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(app):  # noqa: ANN001
+    # Session scope: entering TestClient runs the lifespan (scheduler start,
+    # client prewarm), so one shared client pays that once instead of per
+    # test. Row-level isolation comes from the autouse cleanup below.
     with TestClient(app) as test_client:
         yield test_client
 
@@ -97,8 +104,31 @@ def db_session(session):  # noqa: ANN001
     yield session
 
 
+@pytest.fixture
+def seeded_features(db_session):  # noqa: ANN001
+    # Shared seed for predict/control flows: three sensor readings plus one
+    # weather event, aggregated into a feature row. Core executemany per
+    # table keeps it to one commit with no ORM flush bookkeeping; function
+    # scope because the cleanup fixture below wipes the tables per test.
+    now = datetime.utcnow()
+    db_session.execute(
+        insert(RawSensorEvent),
+        [
+            {"ambient_lux": 200, "presence": True, "timestamp": now - timedelta(minutes=3)},
+            {"ambient_lux": 150, "presence": True, "timestamp": now - timedelta(minutes=2)},
+            {"ambient_lux": 300, "presence": False, "timestamp": now - timedelta(minutes=1)},
+        ],
+    )
+    db_session.execute(
+        insert(WeatherEvent),
+        [{"weather_summary": "Overcast", "temperature_c": 15, "timestamp": now}],
+    )
+    db_session.commit()
+    aggregate_features(db_session, window_minutes=5)
+
+
 @pytest.fixture(autouse=True)
-def cleanup(db_session):  # noqa: ANN001
+def cleanup(db_session, app):  # noqa: ANN001
     yield
     models = (
         Decision,
@@ -112,3 +142,11 @@ def cleanup(db_session):  # noqa: ANN001
     for model in models:
         db_session.query(model).delete()
     db_session.commit()
+    # Wiping the tables is not enough with a session-scoped app: the
+    # in-process caches would keep answering from the deleted rows. Reset
+    # the control service's decision/override snapshots, the cached newest
+    # feature row id, and the sensor-ring singleton (the next get_sensor_ring
+    # call builds a fresh ring that declines windows predating it).
+    app.state.control_service.reset_state()
+    app.state.latest_feature_row_id = None
+    get_sensor_ring.cache_clear()
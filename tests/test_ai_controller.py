@@ -4,7 +4,12 @@ import json
 
 import pytest
 
-from smart_lighting_ai_dali.openai_client import AIController, FeatureWindow
+from smart_lighting_ai_dali.openai_client import (
+    AIController,
+    FeatureWindow,
+    _CircuitBreaker,
+    fallback_batch,
+)
 
 
 class FakeResponses:
@@ -51,6 +56,30 @@ def test_fallback_is_used_when_no_client():
     assert size <= controller.settings.payload_cap_bytes
 
 
+def test_fallback_batch_matches_scalar_rules():
+    controller = AIController(settings=None, client=None)
+    windows = [
+        FeatureWindow(payload={"ambient_lux": 100, "occupancy": 1.0}, timestamp="0"),
+        FeatureWindow(payload={"ambient_lux": 500, "occupancy": 0.0}, timestamp="1"),
+        FeatureWindow(
+            payload={
+                "ambient_lux": 50,
+                "occupancy": 0.9,
+                "impairment_enum": "photosensitive",
+                "weather_summary": "overcast",
+                "time_of_day": "evening",
+            },
+            timestamp="2",
+        ),
+    ]
+    batched = fallback_batch(windows)
+    assert batched.shape == (3, 2)
+    for row, window in zip(batched, windows):
+        scalar = controller.fallback([window])
+        assert int(row[0]) == scalar["intensity_0_100"]
+        assert int(row[1]) == scalar["cct_1800_6500"]
+
+
 def test_openai_response_is_clamped(monkeypatch):
     controller = AIController(client=None)
     controller.client = type(
@@ -70,6 +99,78 @@ def test_openai_response_is_clamped(monkeypatch):
     assert result["cct_1800_6500"] <= 6500
 
 
+class _CountingFailClient:
+    """Minimal client whose create() always raises the given exception."""
+
+    def __init__(self, exc: Exception) -> None:
+        self.responses = self
+        self.exc = exc
+        self.calls = 0
+
+    def create(self, **kwargs):  # noqa: ANN003
+        self.calls += 1
+        raise self.exc
+
+
+def test_circuit_breaker_transitions():
+    breaker = _CircuitBreaker(threshold=2, cooldown=30.0)
+    assert breaker.allow() is True
+
+    breaker.record_failure()
+    assert breaker.state == "CLOSED"
+    breaker.record_failure()
+    assert breaker.state == "OPEN"
+    assert breaker.allow() is False
+
+    # Cool-down elapsed: the next caller becomes the HALF_OPEN probe.
+    breaker.opened_at -= 31.0
+    assert breaker.allow() is True
+    assert breaker.state == "HALF_OPEN"
+
+    # A single failed probe re-opens immediately, threshold or not.
+    breaker.record_failure()
+    assert breaker.state == "OPEN"
+    assert breaker.allow() is False
+
+    breaker.opened_at -= 31.0
+    assert breaker.allow() is True
+    breaker.record_success()
+    assert breaker.state == "CLOSED"
+    assert breaker.failures == 0
+
+
+def test_open_breaker_skips_provider_call():
+    import time
+
+    fake_client = _CountingFailClient(RuntimeError("should not be reached"))
+    controller = AIController(client=fake_client)
+    controller._breaker.state = "OPEN"
+    controller._breaker.opened_at = time.monotonic()
+
+    features = [
+        FeatureWindow(payload={"ambient_lux": 100, "occupancy": 1.0}, timestamp="0")
+    ]
+    result, _ = controller.compute_setpoint(features)
+    assert fake_client.calls == 0
+    assert result["reason"] == "Fallback rules applied"
+
+
+def test_terminal_client_error_skips_retries():
+    class _AuthError(Exception):
+        status_code = 401
+
+    fake_client = _CountingFailClient(_AuthError("unauthorized"))
+    controller = AIController(client=fake_client)
+
+    features = [
+        FeatureWindow(payload={"ambient_lux": 100, "occupancy": 1.0}, timestamp="0")
+    ]
+    result, _ = controller.compute_setpoint(features)
+    # Retrying a non-429 4xx cannot succeed; one attempt, then fallback.
+    assert fake_client.calls == 1
+    assert result["reason"] == "Fallback rules applied"
+
+
 def test_openai_model_and_reasoning_usage():
     from smart_lighting_ai_dali.config import get_settings
 
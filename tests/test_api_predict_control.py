@@ -1,43 +1,7 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
 
-from smart_lighting_ai_dali.feature_engineering import aggregate_features
-from smart_lighting_ai_dali.models import RawSensorEvent, WeatherEvent
-
-
-def seed_features(db_session):
-    now = datetime.utcnow()
-    db_session.query(RawSensorEvent).delete()
-    db_session.query(WeatherEvent).delete()
-    db_session.add_all(
-        [
-            RawSensorEvent(
-                ambient_lux=200,
-                presence=True,
-                timestamp=now - timedelta(minutes=3),
-            ),
-            RawSensorEvent(
-                ambient_lux=150,
-                presence=True,
-                timestamp=now - timedelta(minutes=2),
-            ),
-            RawSensorEvent(
-                ambient_lux=300,
-                presence=False,
-                timestamp=now - timedelta(minutes=1),
-            ),
-        ]
-    )
-    db_session.add(
-        WeatherEvent(weather_summary="Overcast", temperature_c=15, timestamp=now)
-    )
-    db_session.commit()
-    aggregate_features(db_session, window_minutes=5)
-
-
-def test_predict_returns_setpoint(client, db_session):
-    seed_features(db_session)
+def test_predict_returns_setpoint(client, seeded_features):
     response = client.post("/predict", json={})
     assert response.status_code == 200
     data = response.json()
@@ -46,8 +10,7 @@ def test_predict_returns_setpoint(client, db_session):
     assert data["payload_bytes"] <= 2048
 
 
-def test_control_endpoint_and_pagination(client, db_session):
-    seed_features(db_session)
+def test_control_endpoint_and_pagination(client, seeded_features):
     client.post("/predict", json={})
     response = client.post(
         "/control",
@@ -83,9 +46,8 @@ def test_control_requires_override_minutes_when_manual_override_enabled(client):
     assert response.status_code == 422
 
 
-def test_predict_rejects_excessive_payload(client, db_session):
+def test_predict_rejects_excessive_payload(client, seeded_features):
     """Ensure payload size limit is enforced."""
-    seed_features(db_session)
     ai_controller = client.app.state.ai_controller
     original_cap = ai_controller.settings.payload_cap_bytes
     ai_controller.settings.payload_cap_bytes = 10
@@ -2,21 +2,34 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 
+import pytest
+
 from smart_lighting_ai_dali.control_service import ControlService
 from smart_lighting_ai_dali.dali import MockDALIInterface, dt8_warm_cool_to_bytes
 from smart_lighting_ai_dali.models import ManualOverride
 from smart_lighting_ai_dali.retention import prune_old_data
 
 
+@pytest.fixture(scope="module")
+def control_service() -> ControlService:
+    return ControlService(MockDALIInterface())
+
+
+@pytest.fixture(autouse=True)
+def _fresh_control_state(control_service):  # noqa: ANN001
+    # The shared instance caches the last decision and active override;
+    # clear those per test since the cleanup fixture wipes the tables.
+    control_service.reset_state()
+
+
 def test_dt8_mapping():
     data = dt8_warm_cool_to_bytes(4000)
     assert isinstance(data, bytes)
     assert len(data) == 2
 
 
-def test_control_clamps_values(db_session):
-    service = ControlService(MockDALIInterface())
-    decision = service.apply(
+def test_control_clamps_values(db_session, control_service):
+    decision = control_service.apply(
         db_session,
         intensity=150,
         cct=1000,
@@ -27,10 +40,9 @@ def test_control_clamps_values(db_session):
     assert decision.cct >= 1800
 
 
-def test_manual_override_applies(db_session):
-    service = ControlService(MockDALIInterface())
+def test_manual_override_applies(db_session, control_service):
     # create override
-    service.apply(
+    control_service.apply(
         db_session,
         intensity=60,
         cct=3000,
@@ -41,7 +53,7 @@ def test_manual_override_applies(db_session):
     )
     override = db_session.query(ManualOverride).first()
     assert override is not None
-    decision = service.apply(
+    decision = control_service.apply(
         db_session,
         intensity=10,
         cct=6500,
@@ -52,16 +64,15 @@ def test_manual_override_applies(db_session):
     assert decision.manual_override_applied
 
 
-def test_anti_flicker_limits(db_session):
-    service = ControlService(MockDALIInterface())
-    first = service.apply(
+def test_anti_flicker_limits(db_session, control_service):
+    first = control_service.apply(
         db_session,
         intensity=10,
         cct=2000,
         reason="base",
         source="ai",
     )
-    second = service.apply(
+    second = control_service.apply(
         db_session,
         intensity=100,
         cct=6500,
@@ -69,8 +80,8 @@ def test_anti_flicker_limits(db_session):
         source="ai",
     )
     max_delta = (
-        service.settings.anti_flicker_delta_per_second
-        * service.settings.min_update_interval_seconds
+        control_service.settings.anti_flicker_delta_per_second
+        * control_service.settings.min_update_interval_seconds
     )
     assert abs(second.intensity - first.intensity) <= max_delta
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime, timedelta
 
 from smart_lighting_ai_dali.feature_engineering import aggregate_features, prepare_feature_windows
@@ -24,6 +25,22 @@ def test_ingest_sensor_and_weather(client, db_session):
     assert len(weather) == 1
 
 
+def test_ingest_sensor_batch(client, db_session):
+    response = client.post(
+        "/ingest/sensor/batch",
+        json=[
+            {"ambient_lux": 120, "presence": True},
+            {"ambient_lux": 140, "presence": False},
+            {"ambient_lux": 160, "presence": True},
+        ],
+    )
+    assert response.status_code == 201
+    assert response.json() == {"count": 3}
+
+    events = db_session.query(RawSensorEvent).all()
+    assert len(events) == 3
+
+
 def test_feature_aggregation_creates_row(db_session):
     now = datetime.utcnow()
     db_session.add_all(
@@ -51,5 +68,7 @@ def test_feature_aggregation_creates_row(db_session):
 
     windows = prepare_feature_windows(db_session, rows=3)
     assert 1 <= len(windows) <= 3
-    payload_size = len(str(windows[-1]).encode("utf-8"))
+    # Compact JSON matches how the controller actually sizes payloads; ASCII
+    # output means the string length already equals the UTF-8 byte count.
+    payload_size = len(json.dumps(windows[-1], separators=(",", ":")))
     assert payload_size < 1024
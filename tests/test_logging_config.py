@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import logging
 
+from smart_lighting_ai_dali.main import create_app
 
-def test_create_app_configures_logging_once():
-    from smart_lighting_ai_dali.main import create_app
 
+def test_create_app_configures_logging_once():
     root_logger = logging.getLogger()
 
     app1 = create_app()
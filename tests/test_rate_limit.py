@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from smart_lighting_ai_dali import rate_limit
+
+
+class _Clock:
+    """Controllable stand-in for time.monotonic so refill is deterministic."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def _request(host: str = "10.0.0.1") -> SimpleNamespace:
+    return SimpleNamespace(client=SimpleNamespace(host=host))
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:  # noqa: ANN001
+    clock = _Clock()
+    monkeypatch.setattr(rate_limit, "time", clock)
+    return clock
+
+
+def test_exhausted_bucket_returns_429(clock):  # noqa: ANN001
+    limiter = rate_limit.InMemoryRateLimiter()
+    request = _request()
+    for _ in range(int(limiter._capacity)):
+        limiter.check(request)
+    with pytest.raises(HTTPException) as excinfo:
+        limiter.check(request)
+    assert excinfo.value.status_code == 429
+
+
+def test_tokens_refill_over_time(clock):  # noqa: ANN001
+    limiter = rate_limit.InMemoryRateLimiter()
+    request = _request()
+    for _ in range(int(limiter._capacity)):
+        limiter.check(request)
+    with pytest.raises(HTTPException):
+        limiter.check(request)
+
+    # A full window later the bucket is back at capacity.
+    clock.now += float(limiter.settings.rate_limit_window_seconds)
+    limiter.check(request)
+
+
+def test_evict_idle_drops_stale_buckets(clock):  # noqa: ANN001
+    limiter = rate_limit.InMemoryRateLimiter()
+    limiter._max_clients = 2
+    limiter.check(_request("10.0.0.1"))
+    limiter.check(_request("10.0.0.2"))
+
+    # Both buckets sit idle for more than a window, so they have refilled
+    # completely and can be dropped to make room for the new client.
+    clock.now += float(limiter.settings.rate_limit_window_seconds) + 1.0
+    limiter.check(_request("10.0.0.3"))
+    assert set(limiter._buckets) == {"10.0.0.3"}
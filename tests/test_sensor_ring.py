@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from smart_lighting_ai_dali.sensor_ring import SensorRing
+
+
+def test_window_stats_partial_fill():
+    ring = SensorRing(capacity=8)
+    window_start = datetime.utcnow()
+    ring.append(window_start + timedelta(seconds=1), 100.0, True)
+    ring.append(window_start + timedelta(seconds=2), 200.0, False)
+    ring.append(window_start + timedelta(seconds=3), 150.0, True)
+
+    stats = ring.window_stats(window_start)
+    assert stats is not None
+    count, mean, minimum, maximum, delta, occupancy_rate, occupancy_last = stats
+    assert count == 3
+    assert mean == 150.0
+    assert (minimum, maximum) == (100.0, 200.0)
+    assert delta == 50.0  # last minus first, so ordering matters
+    assert occupancy_rate == 2 / 3
+    assert occupancy_last is True
+
+
+def test_window_stats_reorders_after_wraparound():
+    ring = SensorRing(capacity=3)
+    base = datetime.utcnow()
+    for idx, lux in enumerate([1.0, 2.0, 3.0, 4.0, 5.0]):
+        ring.append(base + timedelta(seconds=idx), lux, True)
+
+    # Window starts exactly at the oldest retained reading (lux=3.0). The
+    # raw buffer order after wrapping is [4, 5, 3]; only a chronological
+    # view yields delta = 5 - 3.
+    stats = ring.window_stats(base + timedelta(seconds=2))
+    assert stats is not None
+    count, _, minimum, maximum, delta, _, _ = stats
+    assert count == 3
+    assert (minimum, maximum) == (3.0, 5.0)
+    assert delta == 2.0
+
+
+def test_window_stats_masks_readings_before_window():
+    ring = SensorRing(capacity=8)
+    base = datetime.utcnow()
+    ring.append(base + timedelta(seconds=1), 10.0, False)
+    ring.append(base + timedelta(seconds=2), 20.0, True)
+    ring.append(base + timedelta(seconds=3), 30.0, True)
+
+    stats = ring.window_stats(base + timedelta(seconds=2))
+    assert stats is not None
+    count, mean, minimum, _, _, _, _ = stats
+    assert count == 2
+    assert minimum == 20.0
+    assert mean == 25.0
+
+
+def test_covers_declines_window_predating_ring():
+    # Simulates a restart: events from before the process started live only
+    # in the database, so the ring must decline rather than under-count.
+    window_start = datetime.utcnow() - timedelta(seconds=5)
+    ring = SensorRing(capacity=8)
+    ring.append(datetime.utcnow(), 100.0, True)
+    assert ring.covers(window_start) is False
+    assert ring.window_stats(window_start) is None
+
+
+def test_covers_declines_after_overflow_drops_window_events():
+    ring = SensorRing(capacity=2)
+    base = datetime.utcnow()
+    for idx in range(3):
+        ring.append(base + timedelta(seconds=idx + 1), 100.0, True)
+
+    # The reading at base+1s was overwritten, so the ring no longer holds
+    # every event since `base` and must hand the window to the database.
+    assert ring.covers(base) is False
+    assert ring.window_stats(base) is None
+
+
+def test_window_stats_empty_ring_returns_none():
+    ring = SensorRing(capacity=4)
+    assert ring.window_stats(datetime.utcnow()) is None
@@ -3,39 +3,25 @@ from __future__ import annotations
 import logging
 from datetime import datetime, timedelta
 
+from sqlalchemy import insert
+
 from smart_lighting_ai_dali.dali import MockDALIController
 from smart_lighting_ai_dali.feature_engineering import aggregate_features
-from smart_lighting_ai_dali.models import Decision, RawSensorEvent, WeatherEvent
+from smart_lighting_ai_dali.models import Decision
 from smart_lighting_ai_dali.retention import prune_old_data
 
 
-def _seed_features(db_session) -> None:  # noqa: ANN001
-    now = datetime.utcnow()
-    db_session.add_all(
-        [
-            RawSensorEvent(ambient_lux=220, presence=True, timestamp=now - timedelta(minutes=3)),
-            RawSensorEvent(ambient_lux=180, presence=True, timestamp=now - timedelta(minutes=2)),
-            RawSensorEvent(ambient_lux=260, presence=False, timestamp=now - timedelta(minutes=1)),
-        ]
-    )
-    db_session.add(
-        WeatherEvent(weather_summary="Overcast", temperature_c=15.0, timestamp=now)
-    )
-    db_session.commit()
-    aggregate_features(db_session, window_minutes=5)
-
-
-def test_simulation_predict_control_flow(client, db_session, caplog):  # noqa: ANN001
-    _seed_features(db_session)
-    caplog.set_level(logging.INFO, logger="smart_lighting_ai_dali.dali.interface")
-
+def test_simulation_predict_control_flow(client, seeded_features, caplog):  # noqa: ANN001
     predict_response = client.post("/predict", json={})
     assert predict_response.status_code == 200
 
-    control_response = client.post(
-        "/control",
-        json={"intensity": 55, "cct": 4100, "reason": "sim", "source": "test"},
-    )
+    # Capture only around the control call so the record scan below walks
+    # just the interesting window instead of the whole test's output.
+    with caplog.at_level(logging.INFO, logger="smart_lighting_ai_dali.dali.interface"):
+        control_response = client.post(
+            "/control",
+            json={"intensity": 55, "cct": 4100, "reason": "sim", "source": "test"},
+        )
     assert control_response.status_code == 200
     assert control_response.json()["applied"] is True
 
@@ -45,12 +31,17 @@ def test_simulation_predict_control_flow(client, db_session, caplog):  # noqa: A
 
 
 def test_simulation_telemetry_pagination(client, db_session):  # noqa: ANN001
-    for idx in range(3):
-        response = client.post(
-            "/control",
-            json={"intensity": 40 + idx * 5, "cct": 3900, "reason": "batch", "source": "test"},
-        )
-        assert response.status_code == 200
+    # Pagination only needs rows to exist; seed them with one bulk insert
+    # instead of three full /control round-trips (the control path itself is
+    # covered by the flow test above).
+    db_session.execute(
+        insert(Decision),
+        [
+            {"intensity": 40 + idx * 5, "cct": 3900, "reason": "batch", "source": "test"}
+            for idx in range(3)
+        ],
+    )
+    db_session.commit()
 
     first_page = client.get("/telemetry", params={"limit": 1, "offset": 0})
     assert first_page.status_code == 200
@@ -65,6 +56,49 @@ def test_simulation_telemetry_pagination(client, db_session):  # noqa: ANN001
     assert total_decisions >= 3
 
 
+def test_telemetry_keyset_cursor(client, db_session):  # noqa: ANN001
+    # Distinct decided_at values so the keyset predicate has something to
+    # seek on; the server_default would stamp all three rows identically.
+    now = datetime.utcnow()
+    db_session.execute(
+        insert(Decision),
+        [
+            {
+                "intensity": 30 + idx * 10,
+                "cct": 4000,
+                "reason": "cursor",
+                "source": "test",
+                "decided_at": now - timedelta(minutes=idx),
+            }
+            for idx in range(3)
+        ],
+    )
+    db_session.commit()
+
+    first_page = client.get("/telemetry", params={"limit": 2})
+    assert first_page.status_code == 200
+    payload = first_page.json()
+    assert len(payload["items"]) == 2
+    assert payload["next_cursor"] is not None
+
+    second_page = client.get(
+        "/telemetry", params={"limit": 2, "cursor": payload["next_cursor"]}
+    )
+    assert second_page.status_code == 200
+    second_payload = second_page.json()
+    assert len(second_payload["items"]) == 1
+    assert second_payload["next_cursor"] is None
+    # Keyset pages never overlap: everything on page two predates the cursor.
+    assert all(
+        item["decided_at"] < payload["next_cursor"]
+        for item in second_payload["items"]
+    )
+
+    # Non-positive limits are rejected up front instead of returning a
+    # nonsensical page.
+    assert client.get("/telemetry", params={"limit": 0}).status_code == 422
+
+
 def test_jobs_safe_on_empty_database(db_session):  # noqa: ANN001
     result = aggregate_features(db_session, window_minutes=5)
     assert result is None